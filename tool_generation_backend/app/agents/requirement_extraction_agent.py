@@ -5,7 +5,9 @@ This simple agent takes a string description and converts it
 into a list of UserToolRequirement objects.
 """
 
+import hashlib
 import logging
+from collections import OrderedDict
 from typing import List
 
 import agents
@@ -17,6 +19,13 @@ from app.models.specs import UserToolRequirement
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of task descriptions whose extracted requirements are cached
+EXTRACTION_CACHE_SIZE = 128
+
+# Process-wide LRU cache: sha256(model, instructions, task description) -> requirements.
+# Shared across agent instances since the API builds a new agent per request.
+_extraction_cache: "OrderedDict[str, List[UserToolRequirement]]" = OrderedDict()
+
 
 class RequirementList(BaseModel):
     """List of tool requirements extracted from description."""
@@ -45,6 +54,19 @@ class RequirementExtractionAgent:
         self.available_libraries = repository_service.get_available_packages()
         logger.info(f"Loaded {len(self.available_libraries)} available libraries for requirement extraction")
 
+    def _cache_key(self, task_description: str) -> str:
+        """
+        Build the extraction cache key for a task description.
+
+        The model and agent instructions are part of the key, so changing the
+        prompt template invalidates previously cached results.
+        """
+        digest = hashlib.sha256()
+        for part in (self.settings.openai_model, self._get_agent_instructions(), task_description):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
     def _ensure_agent(self):
         """Lazy initialization of the agent."""
         if self._agent is None:
@@ -78,6 +100,13 @@ class RequirementExtractionAgent:
         Returns:
             List[UserToolRequirement]: Extracted tool requirements
         """
+        cache_key = self._cache_key(task_description)
+        cached = _extraction_cache.get(cache_key)
+        if cached is not None:
+            _extraction_cache.move_to_end(cache_key)
+            logger.info(f"Using cached requirements for: {task_description[:100]}...")
+            return [requirement.model_copy() for requirement in cached]
+
         self._ensure_agent()
 
         try:
@@ -96,6 +125,12 @@ class RequirementExtractionAgent:
 
             logger.info(f"Extracted {len(requirement_list.requirements)} requirements")
 
+            # Only cache successful extractions; empty results may be transient
+            if requirement_list.requirements:
+                _extraction_cache[cache_key] = [r.model_copy() for r in requirement_list.requirements]
+                if len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+                    _extraction_cache.popitem(last=False)
+
             return requirement_list.requirements
 
         except Exception as e:
@@ -5,21 +5,38 @@ For testing purposes only - not production ready.
 
 from fastapi import APIRouter, HTTPException, status, Depends
 from pydantic import BaseModel, Field
+from typing import List, Optional
+import asyncio
+import contextlib
 import logging
 
 from app.agents.requirement_extraction_agent import RequirementExtractionAgent
 from app.services.job_service import JobService
 from app.dependencies import get_job_service
+from app.models.job import JobResponse, TERMINAL_JOB_STATUSES
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+# Most task descriptions accepted in one batch request
+MAX_BATCH_TASKS = 20
+
+# Most LLM extractions a batch request runs at the same time
+MAX_CONCURRENT_EXTRACTIONS = 4
+
+
 class ExtractionRequest(BaseModel):
     """Request to extract requirements from a task description."""
     task_description: str = Field(..., description="Natural language description of tools to build")
     client_id: str = Field(default="extract-api", description="Client identifier")
+    wait_ms: int = Field(
+        default=0,
+        ge=0,
+        le=30000,
+        description="Wait up to this many milliseconds for the job to finish before responding"
+    )
 
 
 class ExtractionResponse(BaseModel):
@@ -27,6 +44,96 @@ class ExtractionResponse(BaseModel):
     job_id: str = Field(..., description="ID of created job")
     requirements_count: int = Field(..., description="Number of requirements extracted")
     status: str = Field(..., description="Job status")
+    final_status: Optional[JobResponse] = Field(
+        default=None,
+        description="Full job status, set when the job finished within wait_ms"
+    )
+
+
+class BatchExtractionRequest(BaseModel):
+    """Request to extract requirements from several task descriptions at once."""
+    tasks: List[ExtractionRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_TASKS,
+        description="Task descriptions to extract and submit"
+    )
+
+
+class BatchTaskResult(BaseModel):
+    """Outcome of one task in a batch request."""
+    index: int = Field(..., description="Position of the task in the request")
+    job: Optional[ExtractionResponse] = Field(default=None, description="Created job, if the task succeeded")
+    error: Optional[str] = Field(default=None, description="Error, if the task could not be submitted")
+
+
+class BatchExtractionResponse(BaseModel):
+    """Response with one result per task."""
+    results: List[BatchTaskResult] = Field(default_factory=list, description="Task results, in request order")
+
+
+async def _extract_and_create_job(
+    request: ExtractionRequest,
+    job_service: JobService,
+    extraction_slots: Optional[asyncio.Semaphore] = None
+) -> ExtractionResponse:
+    """
+    Extract requirements from one task description and submit them as a job.
+
+    Args:
+        request: Task description to extract requirements from
+        job_service: Job service instance
+        extraction_slots: Semaphore bounding concurrent LLM extractions, if any
+
+    Returns:
+        ExtractionResponse with job ID and requirement count
+
+    Raises:
+        HTTPException: If no requirements could be extracted
+        ValueError: If the created job cannot be found
+    """
+    logger.info(f"Extracting requirements from: {request.task_description[:100]}...")
+
+    # Extract requirements
+    agent = RequirementExtractionAgent()
+    async with extraction_slots or contextlib.nullcontext():
+        requirements = await agent.extract_requirements(request.task_description)
+
+    if not requirements:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No valid requirements extracted from description"
+        )
+
+    logger.info(f"Extracted {len(requirements)} requirements")
+
+    # Submit job with task description
+    job_id = await job_service.create_job(
+        user_id=request.client_id,
+        tool_requirements=requirements,
+        task_description=request.task_description
+    )
+
+    # Get job to get short ID
+    job = await job_service.get_job_by_id(job_id)
+    if not job:
+        raise ValueError(f"Job {job_id} not found after creation")
+
+    logger.info(f"Created job {job.job_id} with {len(requirements)} requirements")
+
+    # Optionally hold the response so fast jobs need no status polling
+    final_status = None
+    if request.wait_ms:
+        job = await job_service.wait_for_terminal(job_id, timeout=request.wait_ms / 1000) or job
+        if job.status in TERMINAL_JOB_STATUSES:
+            final_status = await job_service.build_job_response(job)
+
+    return ExtractionResponse(
+        job_id=job.job_id,
+        requirements_count=len(requirements),
+        status=job.status.value,
+        final_status=final_status
+    )
 
 
 @router.post("/extract-and-submit", response_model=ExtractionResponse)
@@ -50,39 +157,7 @@ async def extract_and_submit(
         ExtractionResponse with job ID and requirement count
     """
     try:
-        logger.info(f"Extracting requirements from: {request.task_description[:100]}...")
-
-        # Extract requirements
-        agent = RequirementExtractionAgent()
-        requirements = await agent.extract_requirements(request.task_description)
-
-        if not requirements:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No valid requirements extracted from description"
-            )
-
-        logger.info(f"Extracted {len(requirements)} requirements")
-
-        # Submit job with task description
-        job_id = await job_service.create_job(
-            user_id=request.client_id,
-            tool_requirements=requirements,
-            task_description=request.task_description
-        )
-
-        # Get job to get short ID
-        job = await job_service.get_job_by_id(job_id)
-        if not job:
-            raise ValueError(f"Job {job_id} not found after creation")
-
-        logger.info(f"Created job {job.job_id} with {len(requirements)} requirements")
-
-        return ExtractionResponse(
-            job_id=job.job_id,
-            requirements_count=len(requirements),
-            status=job.status.value
-        )
+        return await _extract_and_create_job(request, job_service)
 
     except HTTPException:
         raise
@@ -91,4 +166,41 @@ async def extract_and_submit(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to extract and submit: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@router.post("/extract-and-submit-batch", response_model=BatchExtractionResponse)
+async def extract_and_submit_batch(
+    request: BatchExtractionRequest,
+    job_service: JobService = Depends(get_job_service)
+) -> BatchExtractionResponse:
+    """
+    Extract requirements from several task descriptions and submit one job each.
+
+    Extractions run concurrently, at most MAX_CONCURRENT_EXTRACTIONS LLM calls
+    at a time. A failing task does not abort the others; its error is
+    reported in its result instead.
+
+    Args:
+        request: Task descriptions to extract requirements from
+        job_service: Job service instance
+
+    Returns:
+        BatchExtractionResponse with one result per task, in request order
+    """
+    extraction_slots = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+    results = await asyncio.gather(
+        *(_extract_and_create_job(task, job_service, extraction_slots) for task in request.tasks),
+        return_exceptions=True
+    )
+
+    response = BatchExtractionResponse()
+    for index, result in enumerate(results):
+        if isinstance(result, ExtractionResponse):
+            response.results.append(BatchTaskResult(index=index, job=result))
+        else:
+            detail = result.detail if isinstance(result, HTTPException) else str(result)
+            logger.error(f"Failed to extract and submit task {index}: {detail}")
+            response.results.append(BatchTaskResult(index=index, error=detail))
+
+    return response
@@ -6,7 +6,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 
 from app.database import ping_database, get_database_stats
@@ -54,6 +54,17 @@ async def health_check() -> HealthResponse:
     )
 
 
+@router.head("/health")
+async def health_check_head() -> Response:
+    """
+    Liveness check without a response body.
+
+    Returns:
+        Empty 200 response
+    """
+    return Response(status_code=200)
+
+
 @router.get("/health/detailed", response_model=DetailedHealthResponse)
 async def detailed_health_check() -> DetailedHealthResponse:
     """
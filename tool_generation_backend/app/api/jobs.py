@@ -2,24 +2,52 @@
 Job management API endpoints for tool generation requests.
 """
 
-from typing import Dict, Any, List
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from typing import Annotated, Dict, Any, List, Optional
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Header, Response
+from fastapi.responses import StreamingResponse
 from datetime import datetime, timezone
 
+import asyncio
+import json
 import logging
 import uuid
 import re
 
 from app.services.job_service import JobService
 from app.models.job import *
-from app.models.tool import ToolStatus
 from app.config import get_settings
-from app.dependencies import get_job_service
+from app.dependencies import get_job_service, get_websocket_manager
+from app.websocket.manager import WebSocketManager
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Seconds between keep-alive comments on an idle event stream
+EVENT_STREAM_KEEPALIVE_SECONDS = 15
+
+
+def _format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Format a single Server-Sent Events frame."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _job_etag(job: Job, tools_updated_at: Optional[datetime] = None) -> str:
+    """
+    Build a weak ETag that changes whenever the job or one of its tools is updated.
+
+    Args:
+        job: Job the response describes
+        tools_updated_at: Latest update time of the job's tools, if they are in the response
+
+    Returns:
+        str: Weak ETag value
+    """
+    updated = job.updated_at.timestamp() if job.updated_at else 0
+    tools_updated = tools_updated_at.timestamp() if tools_updated_at else 0
+    job_status = job.status.value if isinstance(job.status, JobStatus) else job.status
+    return f'W/"{job_status}-{updated}-{job.tools_completed}-{job.tools_failed}-{tools_updated}"'
+
 
 @router.get("", response_model=List[JobResponse])
 async def list_jobs(
@@ -143,14 +171,21 @@ async def submit_tool_generation_job(
 @router.get("/{jobId}", response_model=JobResponse)
 async def get_job_status(
     jobId: str,
-    job_service: JobService = Depends(get_job_service)
+    response: Response,
+    job_service: JobService = Depends(get_job_service),
+    if_none_match: Annotated[Optional[str], Header()] = None
 ) -> JobResponse:
     """
     Get the status of a tool generation job.
 
+    The response carries an ETag; a request whose If-None-Match matches it
+    gets an empty 304 response instead of the full job body.
+
     Args:
         jobId: Job ID (short identifier, e.g., job_abc123)
+        response: Outgoing response, used to set the ETag header
         job_service: Job service instance
+        if_none_match: ETag from a previous response, if any
 
     Returns:
         JobResponse with job status and progress
@@ -166,73 +201,17 @@ async def get_job_status(
 
         logger.info(f"Retrieved job {jobId}")
 
-        # Progress is tracked directly in job counters
-        progress = JobProgress(
-            total=job.total_tools,
-            completed=job.tools_completed,
-            failed=job.tools_failed,
-            inProgress=job.tools_in_progress,
-            currentTool=None if job.is_complete else "processing"
-        )
-
-        # Fetch actual tools from tools collection if completed
-        tool_files_response = None
-        if job.status == JobStatus.COMPLETED:
-            tools_data = await job_service.get_job_tools(job.id)
-            if tools_data:
-                tool_files_response = [
-                    ToolFile(
-                        toolId=tool_dict["id"],
-                        fileName=tool_dict["file_name"],
-                        filePath=tool_dict["file_path"],
-                        description=tool_dict["description"],
-                        code=tool_dict["code"],
-                        endpoint=None,  # No endpoints since we're not using SimpleTooling
-                        registered=tool_dict["status"] == ToolStatus.REGISTERED.value,
-                        createdAt=tool_dict["created_at"].isoformat() if isinstance(tool_dict.get("created_at"), datetime) else tool_dict.get("created_at", datetime.now(timezone.utc).isoformat()),
-                        # Additional file contents
-                        testCode=tool_dict.get("test_code"),
-                        implementationPlan=tool_dict.get("implementation_plan"),
-                        functionSpec=tool_dict.get("function_spec"),
-                        contractsPlan=tool_dict.get("contracts_plan"),
-                        validationRules=tool_dict.get("validation_rules"),
-                        testRequirements=tool_dict.get("test_requirements"),
-                        searchResults=tool_dict.get("search_results")
-                    )
-                    for tool_dict in tools_data
-                ]
-
-        # Fetch failures from tool_failures collection if completed
-        failures_response = None
+        # Completed responses embed tool records, which change independently of the job
+        tools_updated_at = None
         if job.status == JobStatus.COMPLETED:
-            from app.models.tool_generation import ToolGenerationFailure
-            failures_data = await job_service.get_job_failures(job.id)
-            if failures_data:
-                failures_response = [
-                    ToolGenerationFailure(
-                        toolRequirement=failure_dict["user_requirement"],
-                        error=failure_dict["error_message"],
-                        error_type=failure_dict.get("error_type", "unknown")
-                    )
-                    for failure_dict in failures_data
-                ]
+            tools_updated_at = await job_service.get_job_tools_updated_at(job)
 
-        return JobResponse(
-            jobId=jobId,
-            status=job.status.value if isinstance(job.status, JobStatus) else job.status,
-            createdAt=job.created_at.isoformat() if job.created_at else datetime.now(timezone.utc).isoformat(),
-            updatedAt=job.updated_at.isoformat() if job.updated_at else datetime.now(timezone.utc).isoformat(),
-            taskDescription=job.task_description,
-            toolRequirements=job.tool_requirements,
-            progress=progress,
-            toolFiles=tool_files_response,
-            failures=failures_response,
-            summary=GenerationSummary(
-                totalRequested=job.total_tools,
-                successful=job.tools_completed,
-                failed=job.tools_failed
-            ) if job.status == JobStatus.COMPLETED or job.status == "completed" else None
-        )
+        etag = _job_etag(job, tools_updated_at)
+        if if_none_match == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+        return await job_service.build_job_response(job)
 
     except HTTPException:
         raise
@@ -244,6 +223,76 @@ async def get_job_status(
         )
 
 
+@router.get("/{jobId}/events")
+async def stream_job_events(
+    jobId: str,
+    job_service: JobService = Depends(get_job_service),
+    websocket_manager: WebSocketManager = Depends(get_websocket_manager)
+) -> StreamingResponse:
+    """
+    Stream status and progress changes of a job as Server-Sent Events.
+
+    A `status` event with the current job state is sent first, followed by
+    one `progress` or `status` event per change. Once the job reaches a
+    terminal status, the last `status` event carries the full job response
+    (tool files, failures, summary) and the stream ends.
+
+    Args:
+        jobId: Job ID (short identifier, e.g., job_abc123)
+        job_service: Job service instance
+        websocket_manager: WebSocket manager that relays job events
+
+    Returns:
+        StreamingResponse with media type text/event-stream
+    """
+    job = await job_service.get_job_by_job_id(jobId)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {jobId}"
+        )
+
+    async def event_stream():
+        # Subscribe before reading the snapshot so no change is missed in between
+        queue = websocket_manager.subscribe_job(jobId)
+        try:
+            current_job = await job_service.get_job_by_job_id(jobId)
+            if not current_job:
+                return
+            snapshot = await job_service.build_job_response(current_job)
+            yield _format_sse("status", snapshot.model_dump(mode="json"))
+            if snapshot.status in TERMINAL_JOB_STATUSES:
+                return
+
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=EVENT_STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+
+                data = message.get("data", {})
+                if message.get("type") == "job-progress-updated":
+                    yield _format_sse("progress", data)
+                elif message.get("type") == "job-status-changed":
+                    if data.get("status") in TERMINAL_JOB_STATUSES:
+                        final_job = await job_service.get_job_by_job_id(jobId)
+                        if not final_job:
+                            return
+                        final_status = await job_service.build_job_response(final_job)
+                        yield _format_sse("status", final_status.model_dump(mode="json"))
+                        return
+                    yield _format_sse("status", data)
+        finally:
+            websocket_manager.unsubscribe_job(jobId, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
 @router.get("/{jobId}/tasks")
 async def get_job_tasks(
     jobId: str,
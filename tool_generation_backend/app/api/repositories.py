@@ -9,7 +9,7 @@ Provides endpoints for:
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
@@ -87,6 +87,23 @@ async def upload_package_config(
         )
 
 
+@router.get("/upload-config/etag", response_model=Dict[str, Optional[str]])
+async def get_package_config_etag(
+    service: RepositoryService = Depends(get_repository_service)
+) -> Dict[str, Optional[str]]:
+    """
+    Get the digest of the package configuration stored on the backend.
+
+    Clients compare it with package_config_digest of their local config and
+    skip the upload when they match. The etag is None when no valid
+    packages.json exists.
+
+    Returns:
+        Dict with the current etag
+    """
+    return {"etag": service.get_config_etag()}
+
+
 @router.get("/status", response_model=List[RepositoryInfo])
 async def get_repository_status(
     service: RepositoryService = Depends(get_repository_service)
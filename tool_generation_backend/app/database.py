@@ -3,6 +3,7 @@ MongoDB database connection and setup using Motor (async driver).
 Handles connection initialization, database setup, and index creation.
 """
 
+import asyncio
 import logging
 from typing import Optional
 
@@ -73,9 +74,11 @@ async def _create_indexes() -> None:
         task_repo = TaskRepository()
         tool_repo = ToolRepository()
 
-        # Ensure indexes for each collection
-        await task_repo.ensure_indexes()
-        await tool_repo.ensure_indexes()
+        # Ensure indexes for each collection concurrently
+        await asyncio.gather(
+            task_repo.ensure_indexes(),
+            tool_repo.ensure_indexes()
+        )
 
         logging.info("✅ All database indexes created successfully")
 
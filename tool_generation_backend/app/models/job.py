@@ -19,6 +19,10 @@ class JobStatus(str, Enum):
     FAILED = "failed"
 
 
+# Job statuses after which a job no longer changes ('cancelled' is API-only)
+TERMINAL_JOB_STATUSES = {JobStatus.COMPLETED.value, JobStatus.FAILED.value, "cancelled"}
+
+
 class Job(DatabaseModel):
     """Job for bulk tool generation workflow.
 
@@ -2,7 +2,10 @@
 Pydantic models for repository management and registration.
 """
 
+import hashlib
 from typing import List, Dict, Any, Optional
+
+import orjson
 from pydantic import BaseModel, Field, model_validator
 
 
@@ -81,6 +84,35 @@ class PackageConfig(BaseModel):
         return self
 
 
+def package_config_digest(raw_config: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Compute the change-detection digest of a package configuration.
+
+    Each package is validated first, filling in defaults the same way
+    RepositoryService does before saving. An uploaded config and the
+    packages.json written from it therefore get the same digest.
+
+    Args:
+        raw_config: Dictionary mapping package names to package data
+
+    Returns:
+        Hex BLAKE2b digest of the key-sorted JSON encoding of the validated config
+
+    Raises:
+        ValidationError: If a package config is invalid
+    """
+    validated = {}
+    for package_name, package_data in raw_config.items():
+        # Auto-populate package_name from dict key if not provided
+        data = {**package_data, "package_name": package_data.get("package_name") or package_name}
+        validated[package_name] = PackageConfig(**data).model_dump(mode="json")
+
+    return hashlib.blake2b(
+        orjson.dumps(validated, option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).hexdigest()
+
+
 class RepositoryInfo(BaseModel):
     """Runtime information about a repository's status."""
 
@@ -5,6 +5,7 @@ Job repository for bulk tool generation workflow management.
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 from bson import ObjectId
+import asyncio
 import logging
 
 from .base import BaseRepository
@@ -94,6 +95,36 @@ class JobRepository(BaseRepository[Job]):
             logger.error(f"Failed to add task ID to job {job_id}: {e}")
             return False
 
+    async def add_task_ids(self, job_id: str, task_ids: List[str]) -> bool:
+        """
+        Add several task IDs to job's task_ids list in one update.
+
+        Args:
+            job_id: MongoDB _id of the job
+            task_ids: Task IDs to add, in order
+
+        Returns:
+            bool: True if added successfully
+        """
+        if not task_ids:
+            return True
+
+        try:
+            result = await self.collection.update_one(
+                {"_id": ObjectId(job_id)},
+                {"$push": {"task_ids": {"$each": task_ids}}}
+            )
+
+            success = result.modified_count > 0
+            if success:
+                logger.info(f"Added {len(task_ids)} task IDs to job {job_id}")
+
+            return success
+
+        except Exception as e:
+            logger.error(f"Failed to add task IDs to job {job_id}: {e}")
+            return False
+
     async def increment_completed(self, job_id: str) -> bool:
         """
         Atomically increment the tools_completed counter.
@@ -283,20 +314,19 @@ class JobRepository(BaseRepository[Job]):
     async def ensure_indexes(self):
         """Create indexes for optimal query performance."""
         try:
-            # Index for user queries
-            await self.collection.create_index("user_id")
-
-            # Index for status queries
-            await self.collection.create_index("status")
-
-            # Index for job_id queries (direct lookup) - UNIQUE
-            await self.collection.create_index("job_id", unique=True)
-
-            # Compound index for user + status queries
-            await self.collection.create_index([("user_id", 1), ("status", 1)])
-
-            # Index for created_at for sorting
-            await self.collection.create_index("created_at")
+            # Index builds are independent, so issue them concurrently
+            await asyncio.gather(
+                # Index for user queries
+                self.collection.create_index("user_id"),
+                # Index for status queries
+                self.collection.create_index("status"),
+                # Index for job_id queries (direct lookup) - UNIQUE
+                self.collection.create_index("job_id", unique=True),
+                # Compound index for user + status queries
+                self.collection.create_index([("user_id", 1), ("status", 1)]),
+                # Index for created_at for sorting
+                self.collection.create_index("created_at")
+            )
 
             logger.info("Job repository indexes created successfully")
 
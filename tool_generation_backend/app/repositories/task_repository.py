@@ -6,6 +6,7 @@ A Task represents one tool being generated within a Job.
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 from bson import ObjectId
+import asyncio
 import logging
 
 from .base import BaseRepository
@@ -199,23 +200,21 @@ class TaskRepository(BaseRepository[Task]):
     async def ensure_indexes(self):
         """Create indexes for optimal query performance."""
         try:
-            # Index for user queries
-            await self.collection.create_index("user_id")
-
-            # Index for status queries
-            await self.collection.create_index("status")
-
-            # Index for job_id queries (find all tasks for a job)
-            await self.collection.create_index("job_id")
-
-            # Index for task_id queries (direct lookup) - UNIQUE
-            await self.collection.create_index("task_id", unique=True)
-
-            # Compound index for user + status queries
-            await self.collection.create_index([("user_id", 1), ("status", 1)])
-
-            # Index for created_at for sorting
-            await self.collection.create_index("created_at")
+            # Index builds are independent, so issue them concurrently
+            await asyncio.gather(
+                # Index for user queries
+                self.collection.create_index("user_id"),
+                # Index for status queries
+                self.collection.create_index("status"),
+                # Index for job_id queries (find all tasks for a job)
+                self.collection.create_index("job_id"),
+                # Index for task_id queries (direct lookup) - UNIQUE
+                self.collection.create_index("task_id", unique=True),
+                # Compound index for user + status queries
+                self.collection.create_index([("user_id", 1), ("status", 1)]),
+                # Index for created_at for sorting
+                self.collection.create_index("created_at")
+            )
 
             logger.info("Task repository indexes created successfully")
 
@@ -4,6 +4,7 @@ Tool failure repository for storing and retrieving failed tool generation attemp
 
 from typing import List, Optional
 from bson import ObjectId
+import asyncio
 import logging
 
 from .base import BaseRepository
@@ -102,14 +103,15 @@ class ToolFailureRepository(BaseRepository[ToolFailure]):
     async def ensure_indexes(self):
         """Create indexes for optimal query performance."""
         try:
-            # Index for session queries
-            await self.collection.create_index("task_id")
-
-            # Index for error type queries
-            await self.collection.create_index("error_type")
-
-            # Compound index for session + error type
-            await self.collection.create_index([("task_id", 1), ("error_type", 1)])
+            # Index builds are independent, so issue them concurrently
+            await asyncio.gather(
+                # Index for session queries
+                self.collection.create_index("task_id"),
+                # Index for error type queries
+                self.collection.create_index("error_type"),
+                # Compound index for session + error type
+                self.collection.create_index([("task_id", 1), ("error_type", 1)])
+            )
 
             logger.info("Tool failure repository indexes created successfully")
 
@@ -2,9 +2,11 @@
 Tool repository for tool storage and metadata management.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone
 from bson import ObjectId
+from pymongo import ReturnDocument
+import asyncio
 import logging
 import os
 
@@ -71,15 +73,14 @@ class ToolRepository(BaseRepository[Tool]):
         Returns:
             Dict ready for MongoDB insertion
         """
-        data = {
-            "name": result.name,
-            "file_name": result.file_name,
+        # Serialize the whole result in one pass (name, file_name, description,
+        # schemas, dependencies); "success" is not a Tool field
+        data = result.model_dump(exclude={"success"})
+        # Tools store input parameters keyed by name
+        data["input_schema"] = {spec["name"]: spec for spec in data["input_schema"]}
+        data.update({
             "file_path": file_path,
-            "description": result.description,
             "code": code,
-            "input_schema": {spec.name: spec.model_dump() for spec in result.input_schema},
-            "output_schema": result.output_schema.model_dump(),
-            "dependencies": result.dependencies,
             "test_cases": [],  # Will be added later if needed
             "status": ToolStatus.DRAFT.value,  # Serialize enum to string
             "task_id": task_id,
@@ -91,7 +92,7 @@ class ToolRepository(BaseRepository[Tool]):
             "validation_rules": validation_rules,
             "test_requirements": test_requirements,
             "search_results": search_results
-        }
+        })
         return data
 
     async def create_from_generation_result(
@@ -146,27 +147,117 @@ class ToolRepository(BaseRepository[Tool]):
             logger.error(f"Failed to create tool from generation result: {e}")
             raise
 
-    async def get_by_ids(self, tool_ids: List[str]) -> List[Tool]:
+    async def upsert_from_generation_result(
+        self,
+        result: ToolGenerationResult,
+        task_id: str,
+        file_path: str,
+        code: str,
+        **file_contents: Optional[str]
+    ) -> Tuple[str, bool]:
+        """
+        Create a tool from a generation result, or refresh the existing tool with the same name.
+
+        Replaces a get_by_name lookup followed by create or update with a single
+        find_one_and_update(upsert=True). An existing tool only gets its task_id,
+        code and file contents replaced; all other fields are set on insert.
+
+        Args:
+            result: Tool generation result from agent
+            task_id: Task ID that generated this tool
+            file_path: Path where tool file is stored
+            code: Python code implementation
+            **file_contents: Optional file contents, as for create_from_generation_result
+
+        Returns:
+            Tuple[str, bool]: Tool ID and whether the tool was newly created
+        """
+        try:
+            tool_data = self._serialize_tool_data(result, task_id, file_path, code, **file_contents)
+
+            # Fields refreshed on every store; everything else only on insert
+            now = datetime.now(timezone.utc)
+            refreshed = {"task_id": task_id, "code": code, **file_contents, "updated_at": now}
+            on_insert = {key: value for key, value in tool_data.items() if key not in refreshed}
+            on_insert["created_at"] = now
+
+            document = await self.collection.find_one_and_update(
+                {"name": result.name},
+                {"$set": refreshed, "$setOnInsert": on_insert},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+                projection={"_id": 1, "created_at": 1, "updated_at": 1}
+            )
+            tool_id = str(document["_id"])
+            created = document["created_at"] == document["updated_at"]
+
+            logger.info(f"{'Created' if created else 'Updated'} tool {result.name} with ID {tool_id}")
+            return tool_id, created
+
+        except Exception as e:
+            logger.error(f"Failed to upsert tool from generation result: {e}")
+            raise
+
+    async def get_by_ids(
+        self,
+        tool_ids: List[str],
+        projection: Optional[Dict[str, int]] = None
+    ) -> List[Tool]:
         """
         Get multiple tools by their IDs.
 
         Args:
             tool_ids: List of tool IDs (as strings)
+            projection: Fields to exclude, e.g. {"input_schema": 0}. Only fields
+                with a default in Tool may be excluded; they come back as defaults.
 
         Returns:
-            List[Tool]: List of tools (may be shorter than input if some not found)
+            List[Tool]: Tools in the order of tool_ids (may be shorter than input if some not found)
         """
         try:
-            tools = []
-            for tool_id in tool_ids:
-                tool = await self.get_by_id(tool_id)
-                if tool:
-                    tools.append(tool)
-            return tools
+            # One $in query instead of a find_one round-trip per ID;
+            # malformed IDs are skipped like unknown ones
+            object_ids = [ObjectId(tool_id) for tool_id in tool_ids if ObjectId.is_valid(tool_id)]
+            if not object_ids:
+                return []
+
+            documents = await self.collection.find(
+                {"_id": {"$in": object_ids}},
+                projection
+            ).to_list(length=None)
+
+            # $in returns documents in arbitrary order; restore the requested order
+            documents_by_id = {doc["_id"]: doc for doc in documents}
+            return [
+                self._document_to_model(documents_by_id[object_id])
+                for object_id in object_ids
+                if object_id in documents_by_id
+            ]
         except Exception as e:
             logger.error(f"Failed to get tools by IDs: {e}")
             return []
 
+    async def get_latest_update(self, tool_ids: List[str]) -> Optional[datetime]:
+        """
+        Get the most recent updated_at among the given tools.
+
+        Args:
+            tool_ids: List of tool IDs (as strings)
+
+        Returns:
+            Optional[datetime]: Latest update time, or None if no tool was found
+        """
+        object_ids = [ObjectId(tool_id) for tool_id in tool_ids if ObjectId.is_valid(tool_id)]
+        if not object_ids:
+            return None
+
+        document = await self.collection.find_one(
+            {"_id": {"$in": object_ids}},
+            {"updated_at": 1},
+            sort=[("updated_at", -1)]
+        )
+        return document.get("updated_at") if document else None
+
 
     async def update_status(self, tool_id: str, new_status: ToolStatus) -> bool:
         """
@@ -226,23 +317,29 @@ class ToolRepository(BaseRepository[Tool]):
         """
         Search tools by name or description.
 
+        Uses the text index on name and description (see ensure_indexes),
+        so results are ordered by relevance. Matching is word-based with
+        stemming, unlike the earlier case-insensitive substring match: a
+        search for "weight" finds "molecular weight" and "weights", but a
+        partial word such as "mol" no longer matches "molecular".
+
         Args:
-            search_term: Term to search for in name and description
+            search_term: Words to search for in name and description
             limit: Maximum number of tools to return
 
         Returns:
-            List[Tool]: Matching tools
+            List[Tool]: Matching tools, most relevant first
         """
         try:
-            # Create text search query
-            query = {
-                "$or": [
-                    {"name": {"$regex": search_term, "$options": "i"}},
-                    {"description": {"$regex": search_term, "$options": "i"}}
-                ]
-            }
+            documents = await self.collection.find(
+                {"$text": {"$search": search_term}},
+                {"score": {"$meta": "textScore"}}
+            ).sort([("score", {"$meta": "textScore"})]).limit(limit).to_list(length=None)
 
-            return await self.find_many(query, limit=limit, sort_by="created_at")
+            # The relevance score is not a Tool field
+            for doc in documents:
+                doc.pop("score", None)
+            return [self._document_to_model(doc) for doc in documents]
 
         except Exception as e:
             logger.error(f"Failed to search tools with term '{search_term}': {e}")
@@ -315,20 +412,20 @@ class ToolRepository(BaseRepository[Tool]):
     async def ensure_indexes(self):
         """Create indexes for optimal query performance."""
         try:
-            # Unique index for name (deduplication)
-            await self.collection.create_index("name", unique=True)
-
-            # Index for task queries
-            await self.collection.create_index("task_id")
-
-            # Index for status
-            await self.collection.create_index("status")
-
-            # Text index for search functionality
-            await self.collection.create_index([
-                ("name", "text"),
-                ("description", "text")
-            ])
+            # Index builds are independent, so issue them concurrently
+            await asyncio.gather(
+                # Unique index for name (deduplication)
+                self.collection.create_index("name", unique=True),
+                # Index for task queries
+                self.collection.create_index("task_id"),
+                # Index for status
+                self.collection.create_index("status"),
+                # Text index for search functionality
+                self.collection.create_index([
+                    ("name", "text"),
+                    ("description", "text")
+                ])
+            )
 
             logger.info("Tool repository indexes created successfully")
 
@@ -10,8 +10,12 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
 from app.config import get_settings
-from app.models.job import Job, JobStatus
+from app.models.job import (
+    Job, JobStatus, JobProgress, JobResponse, ToolFile, GenerationSummary, TERMINAL_JOB_STATUSES
+)
 from app.models.task import TaskStatus
+from app.models.tool import ToolStatus
+from app.models.tool_generation import ToolGenerationFailure
 from app.models.specs import UserToolRequirement
 from app.repositories.job_repository import JobRepository
 from app.repositories.task_repository import TaskRepository
@@ -21,6 +25,9 @@ from app.services.task_service import TaskService
 
 logger = logging.getLogger(__name__)
 
+# Tool fields not included in ToolFile, so not fetched for job status
+JOB_STATUS_TOOL_PROJECTION = {"input_schema": 0, "dependencies": 0, "test_cases": 0}
+
 
 class JobService:
     """
@@ -107,9 +114,7 @@ class JobService:
                 "task_ids": [],
                 "tools_completed": 0,
                 "tools_failed": 0,
-                "tools_in_progress": 0,
-                "created_at": datetime.now(timezone.utc),
-                "updated_at": datetime.now(timezone.utc)
+                "tools_in_progress": 0
             }
 
             job_id = await self.job_repo.create_job(job_data)
@@ -163,6 +168,7 @@ class JobService:
 
             # Create all tasks immediately - they will run in parallel
             # Concurrency is controlled by the semaphore in TaskService
+            task_ids = []
             for idx, req in enumerate(tool_requirements, 1):
                 try:
                     logger.info(f"Creating task {idx}/{len(tool_requirements)} for job {job_id_short}: {req.description}")
@@ -174,7 +180,7 @@ class JobService:
                         user_id=user_id,
                         requirement=req
                     )
-                    await self.job_repo.add_task_id(job_id, task_id)
+                    task_ids.append(task_id)
 
                     logger.info(f"Task {idx}/{len(tool_requirements)} created: {task_id}")
 
@@ -183,6 +189,9 @@ class JobService:
                     # Increment failed counter since we couldn't even create the task
                     await self.job_repo.increment_failed(job_id)
 
+            # Link all created tasks to the job in a single update
+            await self.job_repo.add_task_ids(job_id, task_ids)
+
             logger.info(f"All {len(tool_requirements)} tasks created for job {job_id_short}. They are now running in parallel.")
 
         except Exception as e:
@@ -282,6 +291,45 @@ class JobService:
         """
         return await self.job_repo.get_by_job_id(job_id_short)
 
+    async def wait_for_terminal(self, job_id: str, timeout: float) -> Optional[Job]:
+        """
+        Wait until a job reaches a terminal status or the timeout expires.
+
+        Listens for the job's status broadcasts instead of polling the database.
+
+        Args:
+            job_id: Job ID (MongoDB _id)
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Optional[Job]: Job in its latest state, if found
+        """
+        job = await self.get_job_by_id(job_id)
+        if not job or timeout <= 0 or job.status in TERMINAL_JOB_STATUSES or not self.websocket_manager:
+            return job
+
+        # Keep the short ID; job is re-read below and may come back None
+        short_id = job.job_id
+        queue = self.websocket_manager.subscribe_job(short_id)
+        try:
+            # Re-read after subscribing so a completion in between is not missed
+            job = await self.get_job_by_id(job_id)
+            if job and job.status not in TERMINAL_JOB_STATUSES:
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + timeout
+                while (remaining := deadline - loop.time()) > 0:
+                    try:
+                        message = await asyncio.wait_for(queue.get(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    if (message.get("type") == "job-status-changed"
+                            and message.get("data", {}).get("status") in TERMINAL_JOB_STATUSES):
+                        break
+        finally:
+            self.websocket_manager.unsubscribe_job(short_id, queue)
+
+        return await self.get_job_by_id(job_id)
+
     async def increment_completed(self, job_id: str):
         """
         Atomically increment the tools_completed counter.
@@ -392,12 +440,116 @@ class JobService:
             logger.error(f"Error getting tasks for job {job_id}: {e}")
             return []
 
-    async def get_job_tools(self, job_id: str) -> List[Dict[str, Any]]:
+    async def get_job_tools_updated_at(self, job: Job) -> Optional[datetime]:
+        """
+        Get when any tool generated by a job was last updated.
+
+        Tool records change (e.g. on registration) without touching the job,
+        so this is needed to tell whether a job response is still current.
+
+        Args:
+            job: Job whose tools to check
+
+        Returns:
+            Optional[datetime]: Latest tool update time, or None if the job has no tools
+        """
+        tasks = await self.task_repo.get_tasks_by_job(job.job_id)
+        tool_ids = [task.tool_id for task in tasks if task.tool_id]
+        if not tool_ids:
+            return None
+        return await self.tool_repo.get_latest_update(tool_ids)
+
+    async def build_job_response(self, job: Job) -> JobResponse:
+        """
+        Build the API status response for a job.
+
+        Tool files, failures and the summary are only included once the job
+        has completed.
+
+        Args:
+            job: Job to describe
+
+        Returns:
+            JobResponse: Job status, progress and, when completed, its results
+        """
+        # Progress is tracked directly in job counters
+        progress = JobProgress(
+            total=job.total_tools,
+            completed=job.tools_completed,
+            failed=job.tools_failed,
+            inProgress=job.tools_in_progress,
+            currentTool=None if job.is_complete else "processing"
+        )
+
+        # Fetch actual tools from tools collection if completed
+        tool_files_response = None
+        if job.status == JobStatus.COMPLETED:
+            tools_data = await self.get_job_tools(job.id, projection=JOB_STATUS_TOOL_PROJECTION)
+            if tools_data:
+                tool_files_response = [
+                    ToolFile(
+                        toolId=tool_dict["id"],
+                        fileName=tool_dict["file_name"],
+                        filePath=tool_dict["file_path"],
+                        description=tool_dict["description"],
+                        code=tool_dict["code"],
+                        endpoint=None,  # No endpoints since we're not using SimpleTooling
+                        registered=tool_dict["status"] == ToolStatus.REGISTERED.value,
+                        createdAt=tool_dict["created_at"].isoformat() if isinstance(tool_dict.get("created_at"), datetime) else tool_dict.get("created_at", datetime.now(timezone.utc).isoformat()),
+                        # Additional file contents
+                        testCode=tool_dict.get("test_code"),
+                        implementationPlan=tool_dict.get("implementation_plan"),
+                        functionSpec=tool_dict.get("function_spec"),
+                        contractsPlan=tool_dict.get("contracts_plan"),
+                        validationRules=tool_dict.get("validation_rules"),
+                        testRequirements=tool_dict.get("test_requirements"),
+                        searchResults=tool_dict.get("search_results")
+                    )
+                    for tool_dict in tools_data
+                ]
+
+        # Fetch failures from tool_failures collection if completed
+        failures_response = None
+        if job.status == JobStatus.COMPLETED:
+            failures_data = await self.get_job_failures(job.id)
+            if failures_data:
+                failures_response = [
+                    ToolGenerationFailure(
+                        toolRequirement=failure_dict["user_requirement"],
+                        error=failure_dict["error_message"],
+                        error_type=failure_dict.get("error_type", "unknown")
+                    )
+                    for failure_dict in failures_data
+                ]
+
+        return JobResponse(
+            jobId=job.job_id,
+            status=job.status.value if isinstance(job.status, JobStatus) else job.status,
+            createdAt=job.created_at.isoformat() if job.created_at else datetime.now(timezone.utc).isoformat(),
+            updatedAt=job.updated_at.isoformat() if job.updated_at else datetime.now(timezone.utc).isoformat(),
+            taskDescription=job.task_description,
+            toolRequirements=job.tool_requirements,
+            progress=progress,
+            toolFiles=tool_files_response,
+            failures=failures_response,
+            summary=GenerationSummary(
+                totalRequested=job.total_tools,
+                successful=job.tools_completed,
+                failed=job.tools_failed
+            ) if job.status == JobStatus.COMPLETED or job.status == "completed" else None
+        )
+
+    async def get_job_tools(
+        self,
+        job_id: str,
+        projection: Optional[Dict[str, int]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get all tools generated by a job.
 
         Args:
             job_id: Job ID (MongoDB _id)
+            projection: Tool fields to leave out (see ToolRepository.get_by_ids)
 
         Returns:
             List[Dict]: List of tool data
@@ -417,7 +569,7 @@ class JobService:
                 return []
 
             # Get tools by IDs
-            tools = await self.tool_repo.get_by_ids(tool_ids)
+            tools = await self.tool_repo.get_by_ids(tool_ids, projection=projection)
 
             return [tool.model_dump() for tool in tools]
 
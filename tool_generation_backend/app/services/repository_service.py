@@ -15,7 +15,8 @@ from app.models.repository import (
     PackageConfig,
     RepositoryInfo,
     RepositoryRegistrationResult,
-    RepositoryRegistrationResponse
+    RepositoryRegistrationResponse,
+    package_config_digest
 )
 from app.agents.repository_agent import RepositoryRegistrationAgent
 from app.utils.repository_utils import (
@@ -37,6 +38,29 @@ class RepositoryService:
         self.configs: Dict[str, PackageConfig] = {}
         self.agent = RepositoryRegistrationAgent()
 
+    def get_config_etag(self) -> Optional[str]:
+        """
+        Compute the digest of the package configuration currently on disk.
+
+        Derived from packages.json on every call, so it survives restarts, is
+        the same across workers and follows edits made outside the upload API.
+
+        Returns:
+            package_config_digest of packages.json, or None if the file is
+            missing or invalid
+        """
+        config_path = Path(self.settings.tools_service_path) / "packages.json"
+
+        try:
+            with open(config_path, 'r') as f:
+                raw_config = json.load(f)
+            return package_config_digest(raw_config)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Cannot compute digest of {config_path}: {e}")
+            return None
+
     def load_package_config(self) -> Dict[str, PackageConfig]:
         """
         Load package configuration from JSON file.
@@ -119,9 +119,7 @@ class TaskService:
                 "tool_requirement": requirement.model_dump(),  # Single requirement
                 "status": TaskStatus.PENDING.value,
                 "tool_id": None,
-                "tool_failure_id": None,
-                "created_at": datetime.now(timezone.utc),
-                "updated_at": datetime.now(timezone.utc)
+                "tool_failure_id": None
             }
 
             # Create task in database
@@ -397,29 +395,16 @@ class TaskService:
             file_path = os.path.join(self.settings.tools_path, task.job_id, task.task_id, tool_result.file_name)
 
             # Read all files (code, test, plan, search results)
-            additional_files = self._read_task_files(task, tool_result.name)
+            additional_files = await self._read_task_files(task, tool_result.name)
 
-            # Check if tool already exists (deduplication)
-            existing_tool = await self.tool_repo.get_by_name(tool_result.name)
-
-            if existing_tool:
-                # Tool exists - update task_id and file contents
-                logger.info(f"Tool {tool_result.name} already exists (ID: {existing_tool.id}), updating task_id and files")
-                update_data = {
-                    "task_id": task_id,
-                    **additional_files  # Update all file contents
-                }
-                await self.tool_repo.update(existing_tool.id, update_data)
-                tool_id = existing_tool.id
-            else:
-                # Create new tool in tools collection
-                logger.info(f"Creating new tool {tool_result.name}")
-                tool_id = await self.tool_repo.create_from_generation_result(
-                    result=tool_result,
-                    task_id=task_id,
-                    file_path=file_path,
-                    **additional_files  # Pass all file contents
-                )
+            # Create the tool, or update task_id and file contents of an
+            # existing tool with the same name (deduplication), in one round-trip
+            tool_id, _ = await self.tool_repo.upsert_from_generation_result(
+                result=tool_result,
+                task_id=task_id,
+                file_path=file_path,
+                **additional_files  # Pass all file contents
+            )
 
             # Set tool ID in task (singular field, not array)
             await self.task_repo.set_tool_id(task_id, tool_id)
@@ -458,7 +443,7 @@ class TaskService:
                 tool_name = failure.toolRequirement.description.split()[0] if failure.toolRequirement.description else "unknown"
                 # Sanitize tool name
                 tool_name = "".join(c for c in tool_name if c.isalnum() or c == "_").lower()
-                partial_files = self._read_task_files(task, tool_name)
+                partial_files = await self._read_task_files(task, tool_name)
             else:
                 partial_files = {}
 
@@ -498,10 +483,62 @@ class TaskService:
             logger.error(f"Error storing generation failure for task {task_id}: {e}")
             # Don't raise - we don't want this to fail the entire workflow
 
-    def _read_task_files(self, task: Task, tool_name: str) -> Dict[str, Optional[str]]:
+    @staticmethod
+    def _read_file(file_path: str, kind: str) -> Optional[str]:
+        """
+        Read a text file, returning None if it is missing or unreadable.
+
+        Args:
+            file_path: Path of the file to read
+            kind: Kind of file, used in log messages
+
+        Returns:
+            File contents, or None
+        """
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, "r") as f:
+                content = f.read()
+            logger.debug(f"Read {kind} file: {file_path}")
+            return content
+        except Exception as e:
+            logger.warning(f"Failed to read {kind} file {file_path}: {e}")
+            return None
+
+    @classmethod
+    def _read_latest_search_results(cls, searches_dir: str) -> Optional[str]:
+        """
+        Read the most recent api_refs_* file in a searches directory.
+
+        Args:
+            searches_dir: Directory containing search result files
+
+        Returns:
+            File contents, or None if there is no readable search result
+        """
+        if not os.path.exists(searches_dir):
+            return None
+        try:
+            # Find all api_refs files (both .md and .json for backwards compatibility)
+            api_ref_files = [f for f in os.listdir(searches_dir)
+                            if f.startswith("api_refs_") and (f.endswith(".md") or f.endswith(".json"))]
+            if not api_ref_files:
+                return None
+            # Sort by modification time, get most recent
+            api_ref_files.sort(key=lambda f: os.path.getmtime(os.path.join(searches_dir, f)), reverse=True)
+        except Exception as e:
+            logger.warning(f"Failed to read search results from {searches_dir}: {e}")
+            return None
+        return cls._read_file(os.path.join(searches_dir, api_ref_files[0]), "search results")
+
+    async def _read_task_files(self, task: Task, tool_name: str) -> Dict[str, Optional[str]]:
         """
         Read all generated files for a task (tool code, test, plan, search results).
 
+        Files are read concurrently in worker threads so the event loop is not
+        blocked on disk I/O.
+
         Args:
             task: Task object with job_id and task_id
             tool_name: Name of the tool (without .py extension)
@@ -510,75 +547,26 @@ class TaskService:
             Dict with file contents (None if file doesn't exist)
         """
         task_dir = os.path.join(self.settings.tools_path, task.job_id, task.task_id)
-
-        files = {
-            "code": None,
-            "test_code": None,
-            "implementation_plan": None,
-            "function_spec": None,
-            "contracts_plan": None,
-            "validation_rules": None,
-            "test_requirements": None,
-            "search_results": None
-        }
-
-        # Read main tool code file
-        tool_file = os.path.join(task_dir, f"{tool_name}.py")
-        if os.path.exists(tool_file):
-            try:
-                with open(tool_file, "r") as f:
-                    files["code"] = f.read()
-                    logger.debug(f"Read tool code file: {tool_file}")
-            except Exception as e:
-                logger.warning(f"Failed to read tool code file {tool_file}: {e}")
-
-        # Read test file
-        test_file = os.path.join(task_dir, "tests", f"test_{tool_name}.py")
-        if os.path.exists(test_file):
-            try:
-                with open(test_file, "r") as f:
-                    files["test_code"] = f.read()
-                    logger.debug(f"Read test file: {test_file}")
-            except Exception as e:
-                logger.warning(f"Failed to read test file {test_file}: {e}")
-
-        # Read plan files
         plan_dir = os.path.join(task_dir, "plan")
-        plan_files_map = {
-            "implementation_plan": "implementation_plan.txt",
-            "function_spec": "function_spec.txt",
-            "contracts_plan": "contracts.txt",
-            "validation_rules": "validation_rules.txt",
-            "test_requirements": "test_requirements.txt"
+
+        # Result key -> (path, kind) for every plain file to read
+        file_sources = {
+            "code": (os.path.join(task_dir, f"{tool_name}.py"), "tool code"),
+            "test_code": (os.path.join(task_dir, "tests", f"test_{tool_name}.py"), "test"),
+            "implementation_plan": (os.path.join(plan_dir, "implementation_plan.txt"), "plan"),
+            "function_spec": (os.path.join(plan_dir, "function_spec.txt"), "plan"),
+            "contracts_plan": (os.path.join(plan_dir, "contracts.txt"), "plan"),
+            "validation_rules": (os.path.join(plan_dir, "validation_rules.txt"), "plan"),
+            "test_requirements": (os.path.join(plan_dir, "test_requirements.txt"), "plan")
         }
 
-        for key, filename in plan_files_map.items():
-            file_path = os.path.join(plan_dir, filename)
-            if os.path.exists(file_path):
-                try:
-                    with open(file_path, "r") as f:
-                        files[key] = f.read()
-                        logger.debug(f"Read plan file: {file_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to read plan file {file_path}: {e}")
-
-        # Read search results (find the most recent api_refs_*.md file)
-        searches_dir = os.path.join(task_dir, "searches")
-        if os.path.exists(searches_dir):
-            try:
-                # Find all api_refs files (both .md and .json for backwards compatibility)
-                api_ref_files = [f for f in os.listdir(searches_dir)
-                                if f.startswith("api_refs_") and (f.endswith(".md") or f.endswith(".json"))]
-                if api_ref_files:
-                    # Sort by modification time, get most recent
-                    api_ref_files.sort(key=lambda f: os.path.getmtime(os.path.join(searches_dir, f)), reverse=True)
-                    latest_file = os.path.join(searches_dir, api_ref_files[0])
-                    with open(latest_file, "r") as f:
-                        files["search_results"] = f.read()
-                        logger.debug(f"Read search results: {latest_file}")
-            except Exception as e:
-                logger.warning(f"Failed to read search results from {searches_dir}: {e}")
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(self._read_file, path, kind) for path, kind in file_sources.values()),
+            asyncio.to_thread(self._read_latest_search_results, os.path.join(task_dir, "searches"))
+        )
 
+        files = dict(zip(file_sources, contents[:-1]))
+        files["search_results"] = contents[-1]
         return files
 
     async def _update_task_status(self, task_id: str, status: TaskStatus, error_message: Optional[str] = None):
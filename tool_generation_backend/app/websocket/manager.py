@@ -3,6 +3,7 @@ WebSocket connection manager for real-time communication.
 """
 
 from typing import Dict, List, Set, Any, Optional
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone
@@ -26,6 +27,9 @@ class WebSocketManager:
         # Global connections (for system-wide notifications)
         self.global_connections: Set[WebSocket] = set()
 
+        # In-process job event subscribers (e.g. SSE streams) by job ID
+        self.job_subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
     async def connect(self, websocket: WebSocket, session_id: str):
         """
         Accept WebSocket connection and add to session room.
@@ -190,8 +194,45 @@ class WebSocketManager:
 
         # Broadcast to all for now (frontend will filter by jobId)
         await self.send_to_all(message)
+
+        # Deliver to job-specific subscribers
+        for queue in self.job_subscribers.get(job_id, set()).copy():
+            queue.put_nowait(message)
+
         logger.debug(f"Broadcasted job message for {job_id}")
 
+    def subscribe_job(self, job_id: str) -> asyncio.Queue:
+        """
+        Subscribe to messages sent for a specific job.
+
+        Args:
+            job_id: Job ID (short identifier)
+
+        Returns:
+            Queue receiving every message passed to send_to_job for this job
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self.job_subscribers.setdefault(job_id, set()).add(queue)
+        logger.debug(f"Added job subscriber for {job_id}")
+        return queue
+
+    def unsubscribe_job(self, job_id: str, queue: asyncio.Queue):
+        """
+        Remove a job subscription created by subscribe_job.
+
+        Args:
+            job_id: Job ID (short identifier)
+            queue: Queue returned by subscribe_job
+        """
+        if job_id in self.job_subscribers:
+            self.job_subscribers[job_id].discard(queue)
+
+            # Clean up empty subscriber sets
+            if not self.job_subscribers[job_id]:
+                del self.job_subscribers[job_id]
+
+        logger.debug(f"Removed job subscriber for {job_id}")
+
     async def send_to_task(self, task_id: str, job_id: str, message: Dict[str, Any]):
         """
         Send task-related message to all connected clients.
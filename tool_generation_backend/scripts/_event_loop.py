@@ -0,0 +1,15 @@
+"""
+Event loop runner shared by the test scripts.
+
+Scripts call run(main()) instead of asyncio.run so they use uvloop, a
+libuv-based event loop installed with uvicorn[standard], when it is
+available and fall back to the default loop otherwise.
+"""
+
+import asyncio
+
+try:
+    import uvloop
+    run = uvloop.run
+except ImportError:
+    run = asyncio.run
@@ -0,0 +1,368 @@
+"""
+Shared client helpers for the requirement extraction + job submission API.
+
+Used by the extract-and-submit test scripts so that session setup, job
+monitoring and result printing live in one place.
+"""
+
+import asyncio
+import socket
+import traceback
+import aiohttp
+import orjson
+from typing import Dict, Any, Optional
+
+from _job_events import TERMINAL_STATUSES, iter_sse_events
+
+# How long the server may hold the submit response waiting for the job to finish
+SUBMIT_WAIT_MS = 5000
+
+# Maximum characters printed per tool field
+PRINT_LIMIT = 120
+
+# Longest task description the test scripts submit, so oversized tasks are
+# rejected before the request is sent (or the LLM is called)
+MAX_DESC = 16000
+
+
+class TaskFailed(Exception):
+    """Raised by a task to cancel its siblings in the same TaskGroup."""
+
+
+def check_task_description(task_description: str) -> bool:
+    """Return True if the task description is within MAX_DESC, printing an error otherwise."""
+    if len(task_description) > MAX_DESC:
+        print(f"❌ Task too long ({len(task_description)} chars, max {MAX_DESC})")
+        return False
+    return True
+
+
+def create_session(base_url: str) -> aiohttp.ClientSession:
+    """
+    Create the HTTP session shared by all requests of a test run.
+
+    One session for the whole run means the health check, submissions and
+    status polls reuse pooled connections. DNS is cached for the run and only
+    IPv4 is resolved, skipping the IPv6-first probe some systems do for
+    localhost.
+
+    Args:
+        base_url: Backend base URL
+
+    Returns:
+        aiohttp.ClientSession bound to base_url
+    """
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=32,
+        keepalive_timeout=30,
+        use_dns_cache=True,
+        ttl_dns_cache=300,
+        family=socket.AF_INET
+    )
+    return aiohttp.ClientSession(
+        base_url=base_url,
+        timeout=aiohttp.ClientTimeout(total=60),
+        connector=connector,
+        # orjson keeps non-ASCII text (Å, Δ, ...) unescaped and encodes faster
+        json_serialize=lambda obj: orjson.dumps(obj).decode()
+    )
+
+
+async def poll_job(session: aiohttp.ClientSession, job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Monitor a job until it reaches a terminal status.
+
+    Args:
+        session: HTTP session bound to the backend base URL
+        job_id: Job to monitor
+
+    Returns:
+        The last job status received, or None if no status could be fetched
+    """
+    print(f"\n2️⃣ Monitoring job {job_id}...")
+    max_attempts = 36  # ~10 minutes with backoff capped at 20s
+    attempt = 0
+    delay = 1.0
+    final_status = None
+
+    while attempt < max_attempts:
+        attempt += 1
+
+        async with session.get(f"/api/v1/jobs/{job_id}") as response:
+            if response.status == 200:
+                status_data = orjson.loads(await response.read())
+                final_status = status_data
+                status = status_data["status"]
+                progress = status_data.get("progress", {})
+
+                print(f"   📊 [{job_id}] Attempt {attempt}: Status = {status}, "
+                      f"Progress = {progress.get('completed', 0)}/{progress.get('total', 0)}")
+
+                if status in TERMINAL_STATUSES:
+                    break
+            else:
+                print(f"   ❌ [{job_id}] Failed to get status: {response.status}")
+
+        # Back off exponentially so fast jobs are detected within seconds
+        if attempt < max_attempts:
+            await asyncio.sleep(delay)
+            delay = min(20.0, delay * 1.5)
+
+    return final_status
+
+
+async def watch_job(session: aiohttp.ClientSession, job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Follow a job's event stream until it reaches a terminal status.
+
+    Falls back to poll_job if the backend does not provide the stream, or if
+    the stream ends before a terminal status.
+
+    Args:
+        session: HTTP session bound to the backend base URL
+        job_id: Job to monitor
+
+    Returns:
+        The last job status received, or None if no status could be fetched
+    """
+    print(f"\n2️⃣ Watching job {job_id}...")
+    final_status = None
+
+    # The stream stays open for the whole job, so only bound the idle time
+    # between frames (the server sends keep-alives every 15s)
+    timeout = aiohttp.ClientTimeout(total=None, sock_read=60)
+    async with session.get(f"/api/v1/jobs/{job_id}/events", timeout=timeout) as response:
+        if response.status != 200:
+            print(f"   ⚠️ [{job_id}] Event stream unavailable ({response.status}), polling instead")
+            return await poll_job(session, job_id)
+
+        async for event, data in iter_sse_events(response):
+            if event == "progress":
+                progress = data.get("progress", {})
+                print(f"   📊 [{job_id}] Progress = {progress.get('completed', 0)}/{progress.get('total', 0)}")
+            elif event == "status":
+                final_status = data
+                print(f"   📊 [{job_id}] Status = {data['status']}")
+                if data["status"] in TERMINAL_STATUSES:
+                    return final_status
+
+    print(f"   ⚠️ [{job_id}] Event stream ended early, polling instead")
+    return await poll_job(session, job_id)
+
+
+def print_final_results(job_id: str, final_status: Optional[Dict[str, Any]], *, quiet: bool = False):
+    """
+    Print the tools, failures and summary of a job.
+
+    Args:
+        job_id: Job to report on
+        final_status: Last job status returned by poll_job, or None
+        quiet: Only print the summary line, skipping per-tool details
+    """
+    print(f"\n3️⃣ Final results for job {job_id}...")
+
+    if not final_status:
+        print(f"   ❌ No status received for job {job_id}")
+        return
+
+    print(f"   📋 Final status: {final_status['status']}")
+
+    if quiet:
+        summary = final_status.get('summary')
+        if summary:
+            print(f"   📊 Summary: {summary['successful']}/{summary['totalRequested']} successful")
+        return
+
+    # Show tools
+    tool_files = final_status.get('toolFiles', [])
+    if tool_files:
+        print(f"\n   🔧 Tools generated: {len(tool_files)}")
+        for tool in tool_files:
+            print(f"      - {tool['fileName']}")
+            print(f"        Description: {tool['description'][:PRINT_LIMIT]}")
+            print(f"        Path: {tool['filePath'][:PRINT_LIMIT]}")
+    else:
+        print(f"   ⚠️ No tools generated")
+
+    # Show failures
+    failures = final_status.get('failures', [])
+    if failures:
+        print(f"\n   ❌ Failures: {len(failures)}")
+        for failure in failures:
+            print(f"      - {failure['error'][:PRINT_LIMIT]}")
+
+    # Show summary
+    summary = final_status.get('summary')
+    if summary:
+        print(f"\n   📊 Summary: {summary['successful']}/{summary['totalRequested']} successful")
+
+
+async def run_extract_and_submit(
+    session: aiohttp.ClientSession,
+    task_description: str,
+    *,
+    quiet: bool = False
+):
+    """
+    Extract requirements from one task description, submit the job and report its results.
+
+    Args:
+        session: HTTP session bound to the backend base URL
+        task_description: Natural language description of the tools to build
+        quiet: Only print the summary line of the results
+
+    Returns:
+        Final job status, or None if submission or monitoring failed
+    """
+
+    if not check_task_description(task_description):
+        return None
+
+    print("🚀 Testing Requirement Extraction + Job Submission")
+    print("=" * 60)
+    print(f"\n📝 Task Description:")
+    print(f"   {task_description.strip()}")
+
+    final_status = None
+    try:
+        # Step 1: Submit to extract-and-submit endpoint
+        print(f"\n1️⃣ Calling /api/v1/extract-and-submit...")
+
+        request_payload = {
+            "task_description": task_description,
+            "client_id": "test-extract-script",
+            "wait_ms": SUBMIT_WAIT_MS
+        }
+
+        async with session.post(
+            "/api/v1/extract-and-submit",
+            json=request_payload
+        ) as response:
+            if response.status == 200:
+                extract_response = orjson.loads(await response.read())
+
+                print(f"   ✅ Requirements extracted and job submitted!")
+                print(f"   Job ID: {extract_response['job_id']}")
+                print(f"   Requirements extracted: {extract_response['requirements_count']}")
+                print(f"   Status: {extract_response['status']}")
+
+                job_id = extract_response['job_id']
+            else:
+                error_text = await response.text()
+                print(f"   ❌ Failed: {response.status}")
+                print(f"   Error: {error_text}")
+                return None
+
+        # Step 2: Monitor job status, unless it already finished during submission
+        if extract_response['status'] in TERMINAL_STATUSES and extract_response.get('final_status'):
+            print(f"\n2️⃣ Job {job_id} finished during submission")
+            final_status = extract_response['final_status']
+        else:
+            final_status = await watch_job(session, job_id)
+
+        # Step 3: Show final results from the last status poll
+        print_final_results(job_id, final_status, quiet=quiet)
+
+    except aiohttp.ClientError as e:
+        print(f"❌ Connection error: {e}")
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        traceback.print_exc()
+
+    print("\n" + "=" * 60)
+    print("🏁 Test completed!")
+
+    return final_status
+
+
+async def run_extract_and_submit_batch(
+    session: aiohttp.ClientSession,
+    task_descriptions: list,
+    *,
+    quiet: bool = False
+):
+    """
+    Submit all task descriptions through the batch endpoint, then monitor the jobs concurrently.
+
+    Args:
+        session: HTTP session bound to the backend base URL
+        task_descriptions: Natural language descriptions, one job each
+        quiet: Only print the summary line of each job's results
+    """
+
+    if not all([check_task_description(t) for t in task_descriptions]):
+        return
+
+    print("🚀 Testing Batch Requirement Extraction + Job Submission")
+    print("=" * 60)
+    print(f"\n📝 Task Descriptions: {len(task_descriptions)}")
+
+    try:
+        # Step 1: Submit all tasks in one request
+        print(f"\n1️⃣ Calling /api/v1/extract-and-submit-batch...")
+
+        request_payload = {
+            "tasks": [
+                {"task_description": t, "client_id": "test-extract-script", "wait_ms": SUBMIT_WAIT_MS}
+                for t in task_descriptions
+            ]
+        }
+
+        async with session.post(
+            "/api/v1/extract-and-submit-batch",
+            json=request_payload
+        ) as response:
+            if response.status == 200:
+                batch_response = orjson.loads(await response.read())
+            else:
+                error_text = await response.text()
+                print(f"   ❌ Failed: {response.status}")
+                print(f"   Error: {error_text}")
+                return
+
+        jobs = []
+        for result in batch_response['results']:
+            job = result['job']
+            if job:
+                jobs.append(job)
+                print(f"   ✅ Task {result['index']} → job {job['job_id']}: {job['requirements_count']} requirements, status {job['status']}")
+            else:
+                print(f"   ❌ Task {result['index']}: {result['error']}")
+
+        job_ids = [job['job_id'] for job in jobs]
+
+        # Step 2: Monitor all unfinished jobs concurrently
+        async def finish(job: Dict[str, Any]):
+            return job.get('final_status') or await watch_job(session, job['job_id'])
+
+        final_statuses = await asyncio.gather(*(finish(job) for job in jobs))
+
+        # Step 3: Show final results from the last status polls
+        for job_id, final_status in zip(job_ids, final_statuses):
+            print_final_results(job_id, final_status, quiet=quiet)
+
+    except aiohttp.ClientError as e:
+        print(f"❌ Connection error: {e}")
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        traceback.print_exc()
+
+    print("\n" + "=" * 60)
+    print("🏁 Test completed!")
+
+
+async def check_health(session: aiohttp.ClientSession):
+    """Check if backend is running."""
+    try:
+        async with session.get("/api/v1/health") as response:
+            if response.status == 200:
+                print("✅ Backend is healthy")
+                return True
+            else:
+                print(f"❌ Backend health check failed: {response.status}")
+                return False
+    except Exception as e:
+        print(f"❌ Cannot connect to backend: {e}")
+        print("💡 Start the backend with: python -m app.main")
+        return False
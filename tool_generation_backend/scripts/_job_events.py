@@ -0,0 +1,33 @@
+"""
+Job event helpers shared by the test scripts.
+
+Holds the job statuses that end monitoring and a parser for the
+Server-Sent Events stream of GET /api/v1/jobs/{jobId}/events.
+"""
+
+from typing import AsyncIterator, Dict, Any, Optional, Tuple
+
+import aiohttp
+import orjson
+
+# Job statuses after which a job no longer changes
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+async def iter_sse_events(response: aiohttp.ClientResponse) -> AsyncIterator[Tuple[Optional[str], Dict[str, Any]]]:
+    """
+    Parse a Server-Sent Events response into (event, data) pairs.
+
+    Args:
+        response: Open text/event-stream response
+
+    Yields:
+        Event name (None if the frame has none) and its decoded JSON data
+    """
+    event = None
+    async for raw_line in response.content:
+        line = raw_line.decode().rstrip("\r\n")
+        if line.startswith("event:"):
+            event = line[len("event:"):].strip()
+        elif line.startswith("data:"):
+            yield event, orjson.loads(line[len("data:"):])
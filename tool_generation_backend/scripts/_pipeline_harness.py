@@ -0,0 +1,216 @@
+"""
+Shared scaffolding for the job submission test scripts.
+
+Each script only defines its job request; this module handles the
+end-to-end flow:
+1. Submit job via POST /api/v1/jobs
+2. Monitor job status
+3. Retrieve and print generated tool results
+"""
+
+import asyncio
+import httpx
+from typing import Dict, Any, Optional
+
+
+async def health_check(client: httpx.AsyncClient) -> bool:
+    """Test if the backend is running."""
+
+    try:
+        response = await client.get("/api/v1/health")
+        if response.status_code == 200:
+            health_data = response.json()
+            print(f"✅ Backend is healthy: {health_data}")
+            return True
+        else:
+            print(f"❌ Backend health check failed: {response.status_code}")
+            return False
+    except Exception as e:
+        print(f"❌ Cannot connect to backend: {e}")
+        print("💡 Make sure the backend is running with: uvicorn app.main:app --reload")
+        return False
+
+
+async def run_job(
+    client: httpx.AsyncClient,
+    job_request: Dict[str, Any],
+    *,
+    poll_interval: float = 20,
+    max_attempts: int = 30
+) -> Optional[Dict[str, Any]]:
+    """
+    Submit a job and wait for it to reach a terminal status.
+
+    Args:
+        client: HTTP client bound to the backend base URL
+        job_request: Job submission payload
+        poll_interval: Seconds between status checks
+        max_attempts: Maximum number of status checks
+
+    Returns:
+        Final job status, or None if submission failed or the job was cancelled
+    """
+    # Step 1: Submit job
+    print("\n1️⃣ Submitting tool generation job...")
+    print(f"   Tool Requirements: {len(job_request['toolRequirements'])}")
+    print(f"   Client ID: {job_request['metadata']['clientId']}")
+
+    response = await client.post("/api/v1/jobs", json=job_request)
+    if response.status_code == 201:
+        job_response = response.json()
+        job_id = job_response["jobId"]
+
+        print(f"   ✅ Job submitted successfully!")
+        print(f"   Job ID: {job_id}")
+        print(f"   Status: {job_response['status']}")
+    else:
+        print(f"   ❌ Failed to submit job: {response.status_code}")
+        print(f"   Error: {response.text}")
+        return None
+
+    # Step 2: Monitor job status
+    print("\n2️⃣ Monitoring job status...")
+    attempt = 0
+    last_status = None
+
+    while attempt < max_attempts:
+        attempt += 1
+
+        response = await client.get(f"/api/v1/jobs/{job_id}")
+        if response.status_code == 200:
+            status_data = response.json()
+            status = status_data["status"]
+            progress = status_data.get("progress", {})
+
+            # Rewrite the status line in place; only start a new line
+            # when the status changes
+            if last_status is not None and status != last_status:
+                print()
+            last_status = status
+            print(f"\r   📊 Attempt {attempt}: Status = {status}, Progress = {progress.get('completed', 0)}/{progress.get('total', 0)}", end="", flush=True)
+
+            if status in ["completed", "failed"]:
+                print()
+                break
+            elif status == "cancelled":
+                print("\n   ⚠️ Job was cancelled")
+                return None
+        else:
+            print(f"\n   ❌ Failed to get status: {response.status_code}")
+            last_status = None
+
+        # Wait before next check
+        if attempt < max_attempts:
+            await asyncio.sleep(poll_interval)
+
+    # Step 3: Get final results (check final job status for toolFiles)
+    print("\n3️⃣ Retrieving final job status...")
+
+    response = await client.get(f"/api/v1/jobs/{job_id}")
+    if response.status_code == 200:
+        return response.json()
+
+    print(f"   ❌ Failed to get final status: {response.status_code}")
+    print(f"   Error: {response.text}")
+    return None
+
+
+def print_results(final_status: Dict[str, Any], *, detailed_failures: bool = False):
+    """
+    Print generated tools, failures and summary of a finished job.
+
+    Args:
+        final_status: Final job status returned by the backend
+        detailed_failures: Print the requirement behind each failure
+    """
+    print(f"   📋 Job completed with status: {final_status['status']}")
+
+    # Check for toolFiles in the completed job response
+    tool_files = final_status.get('toolFiles', [])
+    if tool_files:
+        print(f"   🔧 Tools generated: {len(tool_files)}")
+        for tool_file in tool_files:
+            print(f"      - {tool_file['fileName']}: {tool_file['description']}")
+            print(f"        File: {tool_file['filePath']}")
+            print(f"        Registered: {tool_file['registered']}")
+            print(f"        Code length: {len(tool_file['code'])} characters")
+    else:
+        print(f"   ⚠️ No tool files found in completed job")
+
+    # Check for failures
+    failures = final_status.get('failures', [])
+    if failures and detailed_failures:
+        print(f"\n   ❌ FAILED GENERATIONS: {len(failures)}")
+        print(f"   {'='*70}")
+        for i, failure in enumerate(failures, 1):
+            req = failure.get('toolRequirement', {})
+            error_type = failure.get('error_type', 'unknown')
+            print(f"\n   Failure #{i}: [{error_type}]")
+            print(f"   📝 Requirement: {req.get('description', 'N/A')[:80]}...")
+            print(f"   📥 Input: {req.get('input', 'N/A')}")
+            print(f"   📤 Output: {req.get('output', 'N/A')}")
+            print(f"   ⚠️  Error: {failure.get('error', 'N/A')}")
+            print(f"   {'-'*70}")
+    elif failures:
+        print(f"   ❌ Failed generations: {len(failures)}")
+        for failure in failures:
+            print(f"      - Error: {failure['error']}")
+
+    # Show summary
+    summary = final_status.get('summary')
+    if summary:
+        print(f"   📊 Summary: {summary['successful']}/{summary['totalRequested']} successful")
+
+
+async def run_pipeline_test(
+    base_url: str,
+    job_request: Dict[str, Any],
+    *,
+    poll_interval: float = 20,
+    max_attempts: int = 30,
+    detailed_failures: bool = False
+):
+    """
+    Check backend health, then submit the job and print its results.
+
+    Args:
+        base_url: Backend base URL
+        job_request: Job submission payload
+        poll_interval: Seconds between status checks
+        max_attempts: Maximum number of status checks
+        detailed_failures: Print the requirement behind each failure
+    """
+    # One client for health check, submission and polling, so the
+    # keep-alive connection is reused
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=32)
+    ) as client:
+        print("🔍 Checking backend health...")
+        if not await health_check(client):
+            print("\n💡 Start the backend first:")
+            print("   cd tool_generation_backend")
+            print("   uvicorn app.main:app --reload")
+            return
+
+        print()
+        print("🚀 Testing Tool Generation Pipeline")
+        print("=" * 50)
+
+        try:
+            final_status = await run_job(
+                client,
+                job_request,
+                poll_interval=poll_interval,
+                max_attempts=max_attempts
+            )
+            if final_status:
+                print_results(final_status, detailed_failures=detailed_failures)
+        except httpx.HTTPError as e:
+            print(f"❌ Connection error: {e}")
+        except Exception as e:
+            print(f"❌ Unexpected error: {e}")
+
+    print("\n" + "=" * 50)
+    print("🏁 Pipeline test completed!")
@@ -7,11 +7,13 @@ This script should be run after updating the code to use the consolidated databa
 
 Usage:
     python scripts/migrate_agent_sessions.py [--mongodb-url MONGODB_URL]
+        [--force-merge] [--drop-source | --keep-source]
 """
 
 import asyncio
 import argparse
 import logging
+from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorClient
 
 logging.basicConfig(
@@ -21,7 +23,35 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def migrate_agent_sessions(mongodb_url: str, source_db: str = "tool_generation_service", target_db: str = "agent_browser"):
+async def confirm(prompt: str, answer: Optional[bool] = None) -> bool:
+    """
+    Resolve a yes/no question, prompting only when no answer was preset.
+
+    The prompt runs in the default executor so the event loop is not blocked
+    while waiting for the user.
+
+    Args:
+        prompt: Question shown to the user
+        answer: Preset answer from the command line, or None to ask
+
+    Returns:
+        bool: True if the answer is yes
+    """
+    if answer is not None:
+        return answer
+
+    loop = asyncio.get_running_loop()
+    response = await loop.run_in_executor(None, input, prompt)
+    return response.lower() == "yes"
+
+
+async def migrate_agent_sessions(
+    mongodb_url: str,
+    source_db: str = "tool_generation_service",
+    target_db: str = "agent_browser",
+    force_merge: Optional[bool] = None,
+    drop_source: Optional[bool] = None
+):
     """
     Migrate agent_sessions collection from source database to target database.
 
@@ -29,6 +59,9 @@ async def migrate_agent_sessions(mongodb_url: str, source_db: str = "tool_genera
         mongodb_url: MongoDB connection URL
         source_db: Source database name
         target_db: Target database name
+        force_merge: Merge into an existing target collection without asking
+        drop_source: Drop (True) or keep (False) the source collection
+            without asking; None prompts interactively
     """
     client = None
     try:
@@ -44,19 +77,20 @@ async def migrate_agent_sessions(mongodb_url: str, source_db: str = "tool_genera
         source_database = client[source_db]
         target_database = client[target_db]
 
-        # Check if source collection exists
-        source_collections = await source_database.list_collection_names()
+        # Check if source collection exists (filtered server-side, so at most
+        # one name comes back instead of the full namespace listing)
+        name_filter = {"name": "agent_sessions"}
+        source_collections = set(await source_database.list_collection_names(filter=name_filter))
         if "agent_sessions" not in source_collections:
             logger.info(f"ℹ️  No agent_sessions collection found in {source_db} database")
             logger.info("   Nothing to migrate.")
             return
 
         # Check if target collection already exists
-        target_collections = await target_database.list_collection_names()
+        target_collections = set(await target_database.list_collection_names(filter=name_filter))
         if "agent_sessions" in target_collections:
             logger.warning(f"⚠️  agent_sessions collection already exists in {target_db} database")
-            response = input("   Do you want to merge the collections? (yes/no): ")
-            if response.lower() != "yes":
+            if not await confirm("   Do you want to merge the collections? (yes/no): ", force_merge):
                 logger.info("Migration cancelled")
                 return
 
@@ -96,8 +130,7 @@ async def migrate_agent_sessions(mongodb_url: str, source_db: str = "tool_genera
             logger.info("✅ Migration successful!")
 
             # Ask before deleting source collection
-            response = input(f"\nDelete agent_sessions collection from {source_db}? (yes/no): ")
-            if response.lower() == "yes":
+            if await confirm(f"\nDelete agent_sessions collection from {source_db}? (yes/no): ", drop_source):
                 await source_database.drop_collection("agent_sessions")
                 logger.info(f"✅ Deleted agent_sessions from {source_db}")
             else:
@@ -135,6 +168,25 @@ def main():
         default="agent_browser",
         help="Target database name (default: agent_browser)"
     )
+    parser.add_argument(
+        "--force-merge",
+        action="store_true",
+        help="Merge into an existing target collection without prompting"
+    )
+    source_group = parser.add_mutually_exclusive_group()
+    source_group.add_argument(
+        "--drop-source",
+        dest="drop_source",
+        action="store_true",
+        default=None,
+        help="Delete the source collection after a verified migration without prompting"
+    )
+    source_group.add_argument(
+        "--keep-source",
+        dest="drop_source",
+        action="store_false",
+        help="Keep the source collection after migration without prompting"
+    )
 
     args = parser.parse_args()
 
@@ -149,7 +201,9 @@ def main():
     asyncio.run(migrate_agent_sessions(
         args.mongodb_url,
         args.source_db,
-        args.target_db
+        args.target_db,
+        force_merge=True if args.force_merge else None,
+        drop_source=args.drop_source
     ))
 
 
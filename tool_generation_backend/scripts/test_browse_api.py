@@ -1,18 +1,26 @@
 #!/usr/bin/env python3
 """
-Test script for the refactored execute_codex_browse function.
+Test script for the execute_llm_browse function.
 
-Tests API reference extraction from rdkit documentation.
+Tests API reference search against rdkit documentation.
+
+Usage:
+    python scripts/test_browse_api.py [--parallel]
 """
 
+import argparse
 import asyncio
 import sys
+import time
 from pathlib import Path
+from typing import List
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.utils.codex_utils import execute_codex_browse
+from app.config import get_settings
+from app.models.api_reference import ApiBrowseResult
+from app.utils.llm_backend import execute_llm_browse
 import logging
 
 logging.basicConfig(
@@ -20,11 +28,84 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
-
-async def main():
-    """Test the execute_codex_browse function."""
+LIBRARIES = ["rdkit"]
+JOB_ID = "browse_test"
+
+
+def write_questions_file(questions: List[str], task_id: str) -> str:
+    """
+    Write questions to file in the layout the search agent uses.
+
+    Args:
+        questions: Questions to browse for
+        task_id: Task directory name under the test job
+
+    Returns:
+        str: Path to the created questions file
+    """
+    search_dir = Path(get_settings().tools_path) / JOB_ID / task_id / "search"
+    search_dir.mkdir(parents=True, exist_ok=True)
+
+    questions_file = search_dir / "questions.txt"
+    with open(questions_file, 'w') as f:
+        f.write("# Open Questions\n\n")
+        for i, question in enumerate(questions, 1):
+            f.write(f"{i}. {question}\n")
+
+    return str(questions_file)
+
+
+async def browse(questions: List[str], task_id: str) -> ApiBrowseResult:
+    """
+    Run one browse call for the given questions.
+
+    Args:
+        questions: Questions to browse for
+        task_id: Task directory name; keeps output files of concurrent calls apart
+
+    Returns:
+        ApiBrowseResult: Result of the browse call
+    """
+    return await execute_llm_browse(
+        libraries=LIBRARIES,
+        questions=questions,
+        questions_file_path=write_questions_file(questions, task_id),
+        task_id=task_id,
+        job_id=JOB_ID
+    )
+
+
+async def browse_parallel(questions: List[str]) -> ApiBrowseResult:
+    """
+    Browse each question concurrently and merge the results.
+
+    Args:
+        questions: Independent questions, one browse call each
+
+    Returns:
+        ApiBrowseResult: Merged result; search_results and output files of the
+            successful calls are concatenated and any errors combined
+    """
+    results = await asyncio.gather(
+        *[browse([question], f"query_{i}") for i, question in enumerate(questions, 1)]
+    )
+
+    successful = [result for result in results if result.success]
+    errors = [result.error for result in results if result.error]
+    return ApiBrowseResult(
+        success=bool(successful),
+        library=",".join(LIBRARIES),
+        queries=questions,
+        search_results="\n\n".join(result.search_results for result in successful),
+        output_file=", ".join(result.output_file for result in successful if result.output_file) or None,
+        error="; ".join(errors) if errors else None
+    )
+
+
+async def main(parallel: bool = False):
+    """Test the execute_llm_browse function."""
     print("=" * 60)
-    print("Testing execute_codex_browse with RDKit")
+    print("Testing execute_llm_browse with RDKit")
     print("=" * 60)
 
     # Define test queries
@@ -35,10 +116,15 @@ async def main():
     ]
 
     print(f"\nQueries: {queries}")
-    print("\nExecuting Codex browse...\n")
+    print(f"\nExecuting browse ({'parallel' if parallel else 'batched'})...\n")
 
     # Execute browse
-    result = await execute_codex_browse("rdkit", queries)
+    start_time = time.perf_counter()
+    if parallel:
+        result = await browse_parallel(queries)
+    else:
+        result = await browse(queries, "batched")
+    elapsed = time.perf_counter() - start_time
 
     # Display results
     print("\n" + "=" * 60)
@@ -48,25 +134,12 @@ async def main():
     print(f"\nSuccess: {result.success}")
     print(f"Library: {result.library}")
     print(f"Queries: {result.queries}")
+    print(f"Elapsed: {elapsed:.2f}s")
 
     if result.success:
-        print(f"\n✓ Found {len(result.api_functions)} API functions")
+        print(f"\n✓ Search results: {len(result.search_results)} characters")
         print(f"✓ Output file: {result.output_file}")
-
-        # Display each API function
-        for i, func in enumerate(result.api_functions, 1):
-            print(f"\n{i}. {func.function_name}")
-            print(f"   Description: {func.description[:100]}...")
-            print(f"   Parameters: {len(func.input_schema)}")
-            if func.input_schema:
-                for param in func.input_schema:
-                    print(f"     - {param.name}: {param.type} - {param.description[:50]}...")
-            print(f"   Output: {func.output_schema.type} - {func.output_schema.description[:50]}...")
-            print(f"   Examples: {len(func.examples)}")
-            if func.examples:
-                ex = func.examples[0]
-                print(f"     Example: {ex.description}")
-                print(f"     Code:\n       {ex.code[:100]}...")
+        print(f"\n{result.search_results:.1000}...")
     else:
         print(f"\n✗ Error: {result.error}")
 
@@ -74,4 +147,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Test execute_llm_browse")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Browse each query concurrently instead of in one batched call"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(parallel=args.parallel))
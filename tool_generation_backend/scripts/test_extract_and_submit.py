@@ -3,15 +3,28 @@
 Simple test script for requirement extraction + job submission API.
 
 Usage:
-    python scripts/test_extract_and_submit.py
+    python scripts/test_extract_and_submit.py [--batch] [-q] [--fail-fast]
 """
 
+import argparse
 import asyncio
-import aiohttp
+
+from _event_loop import run
+
+from _extract_client import (
+    check_health,
+    create_session,
+    run_extract_and_submit,
+    run_extract_and_submit_batch,
+    TaskFailed,
+)
 
 # BASE_URL = "https://tool-generation-service.up.railway.app"
 BASE_URL = "http://localhost:8000"
 
+# Maximum number of task descriptions submitted and monitored at once
+MAX_CONCURRENT_TASKS = 4
+
 # task_descriptions = [
 #     r"""
 #     **1.Organic Compounds, Level 1**
@@ -175,145 +188,54 @@ diisopropylammonium_cation_openbabel.xyz (charge = +1; multiplicity = 1)
 """
 ]
 
-async def test_extract_and_submit(task_description: str):
-    """Test the extract and submit endpoint."""
-
-    # Task description to extract requirements from
-
-    print("🚀 Testing Requirement Extraction + Job Submission")
-    print("=" * 60)
-    print(f"\n📝 Task Description:")
-    print(f"   {task_description.strip()}")
-
-    async with aiohttp.ClientSession() as session:
-        try:
-            # Step 1: Submit to extract-and-submit endpoint
-            print(f"\n1️⃣ Calling /api/v1/extract-and-submit...")
-
-            request_payload = {
-                "task_description": task_description,
-                "client_id": "test-extract-script"
-            }
-
-            async with session.post(
-                f"{BASE_URL}/api/v1/extract-and-submit",
-                json=request_payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 200:
-                    extract_response = await response.json()
-
-                    print(f"   ✅ Requirements extracted and job submitted!")
-                    print(f"   Job ID: {extract_response['job_id']}")
-                    print(f"   Requirements extracted: {extract_response['requirements_count']}")
-                    print(f"   Status: {extract_response['status']}")
-
-                    job_id = extract_response['job_id']
-                else:
-                    error_text = await response.text()
-                    print(f"   ❌ Failed: {response.status}")
-                    print(f"   Error: {error_text}")
-                    return
-
-            # Step 2: Monitor job status
-            print(f"\n2️⃣ Monitoring job {job_id}...")
-            max_attempts = 30  # 10 minutes
-            attempt = 0
-
-            while attempt < max_attempts:
-                attempt += 1
-
-                async with session.get(f"{BASE_URL}/api/v1/jobs/{job_id}") as response:
-                    if response.status == 200:
-                        status_data = await response.json()
-                        status = status_data["status"]
-                        progress = status_data.get("progress", {})
-
-                        print(f"   📊 Attempt {attempt}: Status = {status}, "
-                              f"Progress = {progress.get('completed', 0)}/{progress.get('total', 0)}")
-
-                        if status in ["completed", "failed"]:
-                            break
-                    else:
-                        print(f"   ❌ Failed to get status: {response.status}")
-
-                if attempt < max_attempts:
-                    await asyncio.sleep(20)
-
-            # Step 3: Get final results
-            print(f"\n3️⃣ Getting final results...")
-
-            async with session.get(f"{BASE_URL}/api/v1/jobs/{job_id}") as response:
-                if response.status == 200:
-                    final_status = await response.json()
-
-                    print(f"   📋 Final status: {final_status['status']}")
-
-                    # Show tools
-                    tool_files = final_status.get('toolFiles', [])
-                    if tool_files:
-                        print(f"\n   🔧 Tools generated: {len(tool_files)}")
-                        for tool in tool_files:
-                            print(f"      - {tool['fileName']}")
-                            print(f"        Description: {tool['description']}")
-                            print(f"        Path: {tool['filePath']}")
-                    else:
-                        print(f"   ⚠️ No tools generated")
-
-                    # Show failures
-                    failures = final_status.get('failures', [])
-                    if failures:
-                        print(f"\n   ❌ Failures: {len(failures)}")
-                        for failure in failures:
-                            print(f"      - {failure['error']}")
-
-                    # Show summary
-                    summary = final_status.get('summary')
-                    if summary:
-                        print(f"\n   📊 Summary: {summary['successful']}/{summary['totalRequested']} successful")
-
-                else:
-                    print(f"   ❌ Failed to get final status: {response.status}")
-
-        except aiohttp.ClientError as e:
-            print(f"❌ Connection error: {e}")
-        except Exception as e:
-            print(f"❌ Unexpected error: {e}")
-            import traceback
-            traceback.print_exc()
-
-    print("\n" + "=" * 60)
-    print("🏁 Test completed!")
-
-
-async def check_health():
-    """Check if backend is running."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{BASE_URL}/api/v1/health") as response:
-                if response.status == 200:
-                    print("✅ Backend is healthy")
-                    return True
-                else:
-                    print(f"❌ Backend health check failed: {response.status}")
-                    return False
-    except Exception as e:
-        print(f"❌ Cannot connect to backend: {e}")
-        print("💡 Start the backend with: python -m app.main")
-        return False
-
 
 if __name__ == "__main__":
-    async def main():
-        print("🔍 Checking backend health...\n")
-        if await check_health():
-            print()
+    parser = argparse.ArgumentParser(description="Test requirement extraction + job submission")
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit all task descriptions in one /extract-and-submit-batch request"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Only print the summary line of each finished job"
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Cancel the remaining tasks as soon as one job fails"
+    )
+    args = parser.parse_args()
 
-            for task_description in task_descriptions:
-                await test_extract_and_submit(task_description)
-        else:
-            print("\n💡 Start the backend first:")
-            print("   cd tool_generation_backend")
-            print("   python -m app.main")
+    async def main():
+        async with create_session(BASE_URL) as session:
+            print("🔍 Checking backend health...\n")
+            if await check_health(session):
+                print()
 
-    asyncio.run(main())
\ No newline at end of file
+                if args.batch:
+                    await run_extract_and_submit_batch(session, task_descriptions, quiet=args.quiet)
+                else:
+                    # Run tasks concurrently so extraction and polling overlap
+                    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TASKS)
+
+                    async def run_task(task_description: str):
+                        async with semaphore:
+                            final_status = await run_extract_and_submit(session, task_description, quiet=args.quiet)
+                        if args.fail_fast and (not final_status or final_status['status'] != "completed"):
+                            raise TaskFailed(final_status['jobId'] if final_status else "submission failed")
+
+                    # A TaskFailed raised by one task cancels its siblings
+                    try:
+                        async with asyncio.TaskGroup() as tg:
+                            for t in task_descriptions:
+                                tg.create_task(run_task(t))
+                    except* TaskFailed as eg:
+                        print(f"\n🛑 Aborted remaining tasks: {eg.exceptions[0]}")
+            else:
+                print("\n💡 Start the backend first:")
+                print("   cd tool_generation_backend")
+                print("   python -m app.main")
+
+    run(main())
@@ -12,16 +12,19 @@ Usage:
     python scripts/test_mini_pipeline.py "I need tools to calculate molecular properties from SMILES"
 """
 
-import asyncio
 import sys
 import logging
 from pathlib import Path
 
+from _event_loop import run
+from _extract_client import MAX_DESC
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.agents.requirement_extraction_agent import RequirementExtractionAgent
 from app.services.job_service import JobService
+from app.dependencies import get_job_service
 from app.config import get_settings
 
 # Set up logging
@@ -32,72 +35,86 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def run_mini_pipeline(task_description: str, user_id: str = "test_user"):
+async def run_mini_pipeline(
+    task_description: str,
+    extraction_agent: RequirementExtractionAgent,
+    job_service: JobService,
+    user_id: str = "test_user"
+):
     """
     Run the mini-pipeline: extract requirements and submit as job.
 
+    The agent and job service are built once by the caller and reused across
+    invocations, so repeated runs do not re-initialize them.
+
     Args:
         task_description: Natural language description of what to build
+        extraction_agent: Requirement extraction agent to use
+        job_service: Job service used to submit the job
         user_id: User identifier (defaults to "test_user")
 
     Returns:
         str: Job ID if successful, None otherwise
     """
+    if len(task_description) > MAX_DESC:
+        logger.error(
+            "Task too long (%d chars, max %d)",
+            len(task_description),
+            MAX_DESC
+        )
+        return None
+
     try:
-        logger.info("=" * 80)
-        logger.info("MINI-PIPELINE TEST")
-        logger.info("=" * 80)
-        logger.info(f"Task Description: {task_description}")
-        logger.info("")
+        logger.debug("=" * 80)
+        logger.info("Mini-pipeline started: %s", task_description, extra={"task_description": task_description})
 
         # Step 1: Extract requirements using agent
-        logger.info("Step 1: Extracting tool requirements...")
-        extraction_agent = RequirementExtractionAgent()
         requirements = await extraction_agent.extract_requirements(task_description)
 
         if not requirements:
             logger.error("No requirements extracted. Cannot proceed.")
             return None
 
-        logger.info(f"Extracted {len(requirements)} requirement(s):")
-        for i, req in enumerate(requirements, 1):
-            logger.info(f"  {i}. {req.description}")
-            logger.info(f"     Input: {req.input}")
-            logger.info(f"     Output: {req.output}")
-        logger.info("")
+        descriptions = [req.description for req in requirements]
+        logger.info(
+            "Step 1: extracted %d requirement(s): %s",
+            len(requirements),
+            descriptions,
+            extra={"count": len(requirements), "descriptions": descriptions}
+        )
 
         # Step 2: Submit requirements as a job
-        logger.info("Step 2: Submitting job...")
-        job_service = JobService()
         job_id = await job_service.create_job(
             user_id=user_id,
             tool_requirements=requirements
         )
-
-        logger.info(f"Job created successfully!")
-        logger.info(f"Job ID: {job_id}")
-        logger.info("")
+        logger.info("Step 2: submitted job %s", job_id, extra={"job_id": job_id})
 
         # Step 3: Fetch and display job status
-        logger.info("Step 3: Fetching job status...")
         job = await job_service.get_job_by_id(job_id)
 
         if job:
-            logger.info(f"Job Status: {job.status}")
-            logger.info(f"Tools Completed: {job.tools_completed}")
-            logger.info(f"Tools Failed: {job.tools_failed}")
-            logger.info(f"Tools In Progress: {job.tools_in_progress}")
-            logger.info(f"Total Requirements: {len(requirements)}")
+            logger.info(
+                "Step 3: job %s status=%s completed=%d failed=%d in_progress=%d total=%d",
+                job_id,
+                job.status,
+                job.tools_completed,
+                job.tools_failed,
+                job.tools_in_progress,
+                len(requirements),
+                extra={
+                    "job_id": job_id,
+                    "status": job.status,
+                    "tools_completed": job.tools_completed,
+                    "tools_failed": job.tools_failed,
+                    "tools_in_progress": job.tools_in_progress,
+                    "total": len(requirements)
+                }
+            )
         else:
             logger.warning("Could not fetch job status")
 
-        logger.info("")
-        logger.info("=" * 80)
-        logger.info("MINI-PIPELINE COMPLETE")
-        logger.info("=" * 80)
-        logger.info(f"Job ID: {job_id}")
-        logger.info(f"You can monitor progress by querying the job status")
-        logger.info("")
+        logger.debug("=" * 80)
 
         return job_id
 
@@ -121,8 +138,12 @@ async def main():
     task_description = sys.argv[1]
     user_id = sys.argv[2] if len(sys.argv) > 2 else "test_user"
 
+    # Build shared instances once
+    extraction_agent = RequirementExtractionAgent()
+    job_service = get_job_service()
+
     # Run the mini-pipeline
-    job_id = await run_mini_pipeline(task_description, user_id)
+    job_id = await run_mini_pipeline(task_description, extraction_agent, job_service, user_id)
 
     if job_id:
         sys.exit(0)
@@ -131,4 +152,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -15,52 +15,64 @@ Usage:
 import asyncio
 import sys
 from pathlib import Path
-from datetime import datetime
 import time
 
+from _event_loop import run
+
 # Add parent directory to path to import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.utils.codex_utils import run_codex_query
-from app.config import get_settings
+from app.config import Settings, get_settings
+
+# Prompt sent to Codex; filled in per query with str.format_map
+PROMPT_TEMPLATE = """
+Please create a simple Python file named test_query_{query_id}.py that:
+1. Prints "Hello from query {query_id}"
+2. Calculates the sum of numbers from 1 to 100
+3. Prints the result
+
+This is a {duration_hint} test query.
+"""
 
 
-async def run_simple_query(query_id: int, duration_hint: str = "quick"):
+async def run_simple_query(
+    query_id: int,
+    duration_hint: str = "quick",
+    *,
+    tools_service_path: str,
+    run_start: float,
+    timeout: int = 60
+):
     """
     Run a simple Codex query.
 
     Args:
         query_id: Identifier for this query (1 or 2)
         duration_hint: Hint about expected duration
+        tools_service_path: Working directory for Codex
+        run_start: perf_counter() value that log offsets are relative to
+        timeout: Query timeout in seconds
 
     Returns:
         Dict with timing info and success status
     """
-    prompt = f"""
-Please create a simple Python file named test_query_{query_id}.py that:
-1. Prints "Hello from query {query_id}"
-2. Calculates the sum of numbers from 1 to 100
-3. Prints the result
-
-This is a {duration_hint} test query.
-"""
+    prompt = PROMPT_TEMPLATE.format_map({"query_id": query_id, "duration_hint": duration_hint})
 
-    print(f"[Query {query_id}] Starting at {datetime.now().strftime('%H:%M:%S.%f')[:-3]}")
-    start_time = time.time()
+    start_time = time.perf_counter()
+    print(f"[Query {query_id}] +{start_time - run_start:.3f}s start")
 
     try:
-        settings = get_settings()
         result = await run_codex_query(
             query=prompt,
-            working_dir=settings.tools_service_path,
-            timeout=60
+            working_dir=tools_service_path,
+            timeout=timeout
         )
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         elapsed = end_time - start_time
 
-        print(f"[Query {query_id}] Completed at {datetime.now().strftime('%H:%M:%S.%f')[:-3]} "
-              f"(took {elapsed:.2f}s)")
+        print(f"[Query {query_id}] +{end_time - run_start:.3f}s completed (took {elapsed:.2f}s)")
 
         return {
             "query_id": query_id,
@@ -72,11 +84,10 @@ This is a {duration_hint} test query.
         }
 
     except Exception as e:
-        end_time = time.time()
+        end_time = time.perf_counter()
         elapsed = end_time - start_time
 
-        print(f"[Query {query_id}] Failed at {datetime.now().strftime('%H:%M:%S.%f')[:-3]} "
-              f"(took {elapsed:.2f}s)")
+        print(f"[Query {query_id}] +{end_time - run_start:.3f}s failed (took {elapsed:.2f}s)")
         print(f"[Query {query_id}] Error: {e}")
 
         return {
@@ -89,7 +100,7 @@ This is a {duration_hint} test query.
         }
 
 
-async def test_parallel_execution():
+async def test_parallel_execution(settings: Settings):
     """Test if two Codex queries can run in parallel."""
 
     print("🚀 Testing Parallel Codex Execution")
@@ -97,34 +108,34 @@ async def test_parallel_execution():
     print(f"\nStarting two Codex queries concurrently...\n")
 
     # Start both queries at the same time
-    overall_start = time.time()
-
-    # Run both queries concurrently
-    results = await asyncio.gather(
-        run_simple_query(1),
-        run_simple_query(2),
-        return_exceptions=True
-    )
-
-    overall_end = time.time()
+    overall_start = time.perf_counter()
+
+    # Run both queries concurrently; with the eager task factory each query
+    # starts running as soon as its task is created. run_simple_query catches
+    # its own errors and always returns a result dict.
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(run_simple_query(
+                query_id, tools_service_path=settings.tools_service_path, run_start=overall_start
+            ))
+            for query_id in (1, 2)
+        ]
+
+        # Report each query as soon as it finishes
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            print(f"   ✔️  Query {result['query_id']} done in {result['elapsed_time']:.2f}s "
+                  f"(+{time.perf_counter() - overall_start:.3f}s)")
+
+    query1, query2 = (task.result() for task in tasks)
+
+    overall_end = time.perf_counter()
     overall_elapsed = overall_end - overall_start
 
     print(f"\n" + "=" * 70)
     print("📊 Results Summary")
     print("=" * 70)
 
-    # Process results
-    successful_results = [r for r in results if isinstance(r, dict)]
-
-    if len(successful_results) < 2:
-        print("❌ One or both queries failed to complete")
-        for i, result in enumerate(results, 1):
-            if isinstance(result, Exception):
-                print(f"   Query {i}: Exception - {result}")
-        return
-
-    query1, query2 = successful_results
-
     # Print individual timings
     print(f"\n⏱️  Individual Timings:")
     print(f"   Query 1: {query1['elapsed_time']:.2f}s (Success: {query1['success']})")
@@ -173,7 +184,7 @@ async def test_parallel_execution():
         print(f"      There may be some parallelization but with contention or variable performance")
 
     # Show errors if any
-    errors = [r for r in successful_results if r['error']]
+    errors = [r for r in (query1, query2) if r['error']]
     if errors:
         print(f"\n⚠️  Errors encountered:")
         for result in errors:
@@ -182,9 +193,8 @@ async def test_parallel_execution():
     print("\n" + "=" * 70)
 
 
-async def check_backend():
+async def check_backend(settings: Settings):
     """Check if the LLM backend is configured for Codex."""
-    settings = get_settings()
     backend = settings.llm_backend.lower()
 
     print(f"🔍 Checking configuration...\n")
@@ -209,9 +219,12 @@ async def check_backend():
 
 if __name__ == "__main__":
     async def main():
-        if await check_backend():
-            await test_parallel_execution()
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+        settings = get_settings()
+        if await check_backend(settings):
+            await test_parallel_execution(settings)
         else:
             print("\n💡 Please fix configuration issues before running this test")
 
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
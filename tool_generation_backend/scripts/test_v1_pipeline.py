@@ -14,15 +14,121 @@ Usage:
 import asyncio
 import aiohttp
 import json
+import orjson
+import random
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from _event_loop import run
+from _job_events import TERMINAL_STATUSES, iter_sse_events
 
 # BASE_URL = "https://tool-generation-service.up.railway.app"
 BASE_URL = "http://127.0.0.1:8000"
 # BASE_URL = "http://100.116.240.11:8000"
 # BASE_URL = "https://tool-generation-service-staging.up.railway.app"
 
-async def test_tool_generation_pipeline():
+# Status polling: exponential backoff with jitter, capped, within a wall-clock budget
+POLL_INITIAL_DELAY = 1.0
+POLL_MAX_DELAY = 20.0
+POLL_BACKOFF = 1.5
+POLL_TIMEOUT = 600  # 10 minutes
+
+
+async def follow_job_events(session: aiohttp.ClientSession, job_id: str) -> Optional[str]:
+    """
+    Follow the job's Server-Sent Events stream until it reaches a terminal status.
+
+    Args:
+        session: Shared HTTP session
+        job_id: Job to monitor
+
+    Returns:
+        Terminal status; the last status received if POLL_TIMEOUT expired
+        first; or None if the backend has no event stream or the stream ended
+        without a terminal status, so the caller falls back to polling
+    """
+    status = None
+
+    # The session's 60s total timeout would cut the stream; only bound the
+    # idle time between frames (the server sends keep-alives every 15s)
+    timeout = aiohttp.ClientTimeout(total=None, sock_read=60)
+    async with session.get(
+        f"{BASE_URL}/api/v1/jobs/{job_id}/events",
+        headers={"Accept": "text/event-stream"},
+        timeout=timeout
+    ) as response:
+        if response.status != 200:
+            print(f"   ⚠️ Event stream unavailable ({response.status}), polling instead")
+            return None
+
+        try:
+            async with asyncio.timeout(POLL_TIMEOUT):
+                async for event, data in iter_sse_events(response):
+                    if event == "progress":
+                        progress = data.get("progress", {})
+                        print(f"   📊 Progress = {progress.get('completed', 0)}/{progress.get('total', 0)}")
+                    elif event == "status":
+                        status = data["status"]
+                        print(f"   📊 Status = {status}")
+                        if status in TERMINAL_STATUSES:
+                            return status
+        except TimeoutError:
+            # The polling budget is used up as well; don't start polling
+            print(f"   ⚠️ No terminal status after {POLL_TIMEOUT}s")
+            return status
+
+    print("   ⚠️ Event stream ended early, polling instead")
+    return None
+
+
+async def poll_job_status(session: aiohttp.ClientSession, job_id: str) -> Optional[str]:
+    """
+    Poll the job status until it reaches a terminal status or the deadline passes.
+
+    Args:
+        session: Shared HTTP session
+        job_id: Job to monitor
+
+    Returns:
+        Last status received, or None if no status could be fetched
+    """
+    deadline = time.monotonic() + POLL_TIMEOUT
+    delay = POLL_INITIAL_DELAY
+    attempt = 0
+    last_etag = None
+    status = None
+
+    while time.monotonic() < deadline:
+        attempt += 1
+
+        # Conditional GET: the server answers 304 while the job is unchanged
+        headers = {"If-None-Match": last_etag} if last_etag else None
+        async with session.get(f"{BASE_URL}/api/v1/jobs/{job_id}", headers=headers) as response:
+            if response.status == 304:
+                print(f"   📊 Attempt {attempt}: unchanged")
+            elif response.status == 200:
+                last_etag = response.headers.get("ETag")
+                status_data = await response.json(loads=orjson.loads)
+                status = status_data["status"]
+                progress = status_data.get("progress", {})
+
+                print(f"   📊 Attempt {attempt}: Status = {status}, Progress = {progress.get('completed', 0)}/{progress.get('total', 0)}")
+
+                if status in TERMINAL_STATUSES:
+                    return status
+            else:
+                print(f"   ❌ Failed to get status: {response.status}")
+
+        # Wait before next check, without sleeping past the deadline
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            await asyncio.sleep(min(delay + random.uniform(0, 0.25 * delay), remaining))
+            delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+
+    return status
+
+
+async def test_tool_generation_pipeline(session: aiohttp.ClientSession):
     """Test the complete tool generation pipeline."""
 
     # Test job request with one reasonable and one unreasonable requirement
@@ -48,119 +154,106 @@ async def test_tool_generation_pipeline():
     print("🚀 Testing Tool Generation Pipeline")
     print("=" * 50)
 
-    async with aiohttp.ClientSession() as session:
-        try:
-            # Step 1: Submit job
-            print("\n1️⃣ Submitting tool generation job...")
-            print(f"   Tool Requirements: {len(job_request['toolRequirements'])}")
-            print(f"   Client ID: {job_request['metadata']['clientId']}")
-
-            async with session.post(
-                f"{BASE_URL}/api/v1/jobs",
-                json=job_request,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                if response.status == 201:
-                    job_response = await response.json()
-                    job_id = job_response["jobId"]
-
-                    print(f"   ✅ Job submitted successfully!")
-                    print(f"   Job ID: {job_id}")
-                    print(f"   Status: {job_response['status']}")
-                else:
-                    error_text = await response.text()
-                    print(f"   ❌ Failed to submit job: {response.status}")
-                    print(f"   Error: {error_text}")
-                    return
-
-            # Step 2: Monitor job status
-            print("\n2️⃣ Monitoring job status...")
-            max_attempts = 30  # 10 minutes with 20s intervals
-            attempt = 0
-
-            while attempt < max_attempts:
-                attempt += 1
-
-                async with session.get(f"{BASE_URL}/api/v1/jobs/{job_id}") as response:
-                    if response.status == 200:
-                        status_data = await response.json()
-                        status = status_data["status"]
-                        progress = status_data.get("progress", {})
-
-                        print(f"   📊 Attempt {attempt}: Status = {status}, Progress = {progress.get('completed', 0)}/{progress.get('total', 0)}")
-
-                        if status in ["completed", "failed"]:
-                            break
-                        elif status == "cancelled":
-                            print("   ⚠️ Job was cancelled")
-                            return
-                    else:
-                        print(f"   ❌ Failed to get status: {response.status}")
-
-                # Wait before next check
-                if attempt < max_attempts:
-                    await asyncio.sleep(20)
-
-            # Step 3: Get final results (check final job status for toolFiles)
-            print("\n3️⃣ Retrieving final job status...")
-
-            async with session.get(f"{BASE_URL}/api/v1/jobs/{job_id}") as response:
-                if response.status == 200:
-                    final_status = await response.json()
-
-                    print(f"   📋 Job completed with status: {final_status['status']}")
-
-                    # Check for toolFiles in the completed job response
-                    tool_files = final_status.get('toolFiles', [])
-                    if tool_files:
-                        print(f"   🔧 Tools generated: {len(tool_files)}")
-                        for tool_file in tool_files:
-                            print(f"      - {tool_file['fileName']}: {tool_file['description']}")
-                            print(f"        File: {tool_file['filePath']}")
-                            print(f"        Registered: {tool_file['registered']}")
-                            print(f"        Code length: {len(tool_file['code'])} characters")
-                    else:
-                        print(f"   ⚠️ No tool files found in completed job")
-
-                    # Check for failures
-                    failures = final_status.get('failures', [])
-                    if failures:
-                        print(f"   ❌ Failed generations: {len(failures)}")
-                        for failure in failures:
-                            print(f"      - Error: {failure['error']}")
-
-                    # Show summary
-                    summary = final_status.get('summary')
-                    if summary:
-                        print(f"   📊 Summary: {summary['successful']}/{summary['totalRequested']} successful")
+    try:
+        # Step 1: Submit job
+        print("\n1️⃣ Submitting tool generation job...")
+        print(f"   Tool Requirements: {len(job_request['toolRequirements'])}")
+        print(f"   Client ID: {job_request['metadata']['clientId']}")
+
+        async with session.post(
+            f"{BASE_URL}/api/v1/jobs",
+            json=job_request,
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            if response.status == 201:
+                job_response = await response.json(loads=orjson.loads)
+                job_id = job_response["jobId"]
+
+                print(f"   ✅ Job submitted successfully!")
+                print(f"   Job ID: {job_id}")
+                print(f"   Status: {job_response['status']}")
+            else:
+                error_text = await response.text()
+                print(f"   ❌ Failed to submit job: {response.status}")
+                print(f"   Error: {error_text}")
+                return
+
+        # Step 2: Monitor job status, via the event stream when available
+        print("\n2️⃣ Monitoring job status...")
+        status = await follow_job_events(session, job_id)
+        if status is None:
+            status = await poll_job_status(session, job_id)
+        if status == "cancelled":
+            print("   ⚠️ Job was cancelled")
+            return
+
+        # Step 3: Get final results (check final job status for toolFiles)
+        print("\n3️⃣ Retrieving final job status...")
+
+        async with session.get(f"{BASE_URL}/api/v1/jobs/{job_id}") as response:
+            if response.status == 200:
+                final_status = await response.json(loads=orjson.loads)
 
+                print(f"   📋 Job completed with status: {final_status['status']}")
+
+                # Check for toolFiles in the completed job response
+                tool_files = final_status.get('toolFiles', [])
+                if tool_files:
+                    print(f"   🔧 Tools generated: {len(tool_files)}")
+                    for tool_file in tool_files:
+                        print(f"      - {tool_file['fileName']}: {tool_file['description']}")
+                        print(f"        File: {tool_file['filePath']}")
+                        print(f"        Registered: {tool_file['registered']}")
+                        print(f"        Code length: {len(tool_file['code'])} characters")
                 else:
-                    error_text = await response.text()
-                    print(f"   ❌ Failed to get final status: {response.status}")
-                    print(f"   Error: {error_text}")
+                    print(f"   ⚠️ No tool files found in completed job")
+
+                # Check for failures
+                failures = final_status.get('failures', [])
+                if failures:
+                    print(f"   ❌ Failed generations: {len(failures)}")
+                    for failure in failures:
+                        print(f"      - Error: {failure['error']}")
+
+                # Show summary
+                summary = final_status.get('summary')
+                if summary:
+                    print(f"   📊 Summary: {summary['successful']}/{summary['totalRequested']} successful")
 
-        except aiohttp.ClientError as e:
-            print(f"❌ Connection error: {e}")
-        except Exception as e:
-            print(f"❌ Unexpected error: {e}")
+            else:
+                error_text = await response.text()
+                print(f"   ❌ Failed to get final status: {response.status}")
+                print(f"   Error: {error_text}")
+
+    except aiohttp.ClientError as e:
+        print(f"❌ Connection error: {e}")
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
 
     print("\n" + "=" * 50)
     print("🏁 Pipeline test completed!")
 
 
-async def test_health_check():
+async def test_health_check(session: aiohttp.ClientSession):
     """Test if the backend is running."""
-
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{BASE_URL}/api/v1/health") as response:
-                if response.status == 200:
-                    health_data = await response.json()
-                    print(f"✅ Backend is healthy: {health_data}")
-                    return True
-                else:
-                    print(f"❌ Backend health check failed: {response.status}")
-                    return False
+        # HEAD is enough for liveness; fall back to GET on servers without it
+        async with session.head(f"{BASE_URL}/api/v1/health") as response:
+            if response.status == 200:
+                print("✅ Backend is healthy")
+                return True
+            if response.status != 405:
+                print(f"❌ Backend health check failed: {response.status}")
+                return False
+
+        async with session.get(f"{BASE_URL}/api/v1/health") as response:
+            if response.status == 200:
+                health_data = await response.json(loads=orjson.loads)
+                print(f"✅ Backend is healthy: {health_data}")
+                return True
+            else:
+                print(f"❌ Backend health check failed: {response.status}")
+                return False
     except Exception as e:
         print(f"❌ Cannot connect to backend: {e}")
         print("💡 Make sure the backend is running with: uvicorn app.main:app --reload")
@@ -169,13 +262,20 @@ async def test_health_check():
 
 if __name__ == "__main__":
     async def main():
-        print("🔍 Checking backend health...")
-        if await test_health_check():
-            print()
-            await test_tool_generation_pipeline()
-        else:
-            print("\n💡 Start the backend first:")
-            print("   cd tool_generation_backend")
-            print("   uvicorn app.main:app --reload")
-
-    asyncio.run(main())
\ No newline at end of file
+        # One session for the health check, submission and all status polls,
+        # so the pooled keep-alive connection is reused throughout
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=60),
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75),
+            json_serialize=lambda obj: orjson.dumps(obj).decode()
+        ) as session:
+            print("🔍 Checking backend health...")
+            if await test_health_check(session):
+                print()
+                await test_tool_generation_pipeline(session)
+            else:
+                print("\n💡 Start the backend first:")
+                print("   cd tool_generation_backend")
+                print("   uvicorn app.main:app --reload")
+
+    run(main())
\ No newline at end of file
@@ -5,6 +5,12 @@ Upload package configuration and register all repositories.
 This script uploads a packages.json file to the backend and then
 triggers registration for all packages missing navigation guides.
 
+The upload is skipped when the backend already holds the same config. To
+compare them, the script imports package_config_digest from
+app.models.repository, so it must run from this repository with the
+backend's Pydantic models importable. It needs no app settings or
+database.
+
 Usage:
     python scripts/upload_and_register.py <config_file.json>
     python scripts/upload_and_register.py  # Uses default tool_service/packages.json
@@ -15,21 +21,67 @@ import json
 import asyncio
 import argparse
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 import httpx
+import orjson
+
+from _event_loop import run
 
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models.repository import package_config_digest
 
 # Default configuration
 DEFAULT_CONFIG_FILE = Path(__file__).parent.parent.parent / "tool_service" / "packages.json"
 DEFAULT_BASE_URL = "http://localhost:8000"
 
 
-async def upload_config(base_url: str, config_data: Dict[str, Any]) -> Dict[str, Any]:
+def local_config_digest(config_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Compute the digest of the local configuration.
+
+    Args:
+        config_data: Package configuration dictionary
+
+    Returns:
+        package_config_digest of the config, or None if it does not validate
+        (it is then uploaded so the backend reports the errors)
+    """
+    try:
+        return package_config_digest(config_data)
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+async def get_config_etag(client: httpx.AsyncClient, base_url: str) -> Optional[str]:
+    """
+    Fetch the digest of the configuration stored on the backend.
+
+    Args:
+        client: Shared HTTP client
+        base_url: Base URL of the backend API
+
+    Returns:
+        The backend's config etag, or None if unknown or unsupported
+    """
+    response = await client.get(f"{base_url}/api/v1/repositories/upload-config/etag")
+    if response.status_code != 200:
+        return None
+    return orjson.loads(response.content).get("etag")
+
+
+async def upload_config(
+    client: httpx.AsyncClient,
+    base_url: str,
+    config_data: Dict[str, Any]
+) -> Dict[str, Any]:
     """
     Upload package configuration to the backend.
 
     Args:
+        client: Shared HTTP client
         base_url: Base URL of the backend API
         config_data: Package configuration dictionary
 
@@ -44,13 +96,14 @@ async def upload_config(base_url: str, config_data: Dict[str, Any]) -> Dict[str,
     print(f"📤 Uploading configuration to {url}")
     print(f"   Packages: {', '.join(config_data.keys())}")
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            url,
-            json={"config": config_data}
-        )
-        response.raise_for_status()
-        result = response.json()
+    # Encode with orjson and send the bytes as-is, bypassing httpx's json encoder
+    response = await client.post(
+        url,
+        content=orjson.dumps({"config": config_data}),
+        headers={"content-type": "application/json"}
+    )
+    response.raise_for_status()
+    result = response.json()
 
     print(f"✅ Upload successful: {result['package_count']} packages")
     print(f"   Saved to: {result['file_path']}")
@@ -58,11 +111,12 @@ async def upload_config(base_url: str, config_data: Dict[str, Any]) -> Dict[str,
     return result
 
 
-async def register_all(base_url: str) -> Dict[str, Any]:
+async def register_all(client: httpx.AsyncClient, base_url: str) -> Dict[str, Any]:
     """
     Register all packages missing navigation guides.
 
     Args:
+        client: Shared HTTP client
         base_url: Base URL of the backend API
 
     Returns:
@@ -76,10 +130,9 @@ async def register_all(base_url: str) -> Dict[str, Any]:
     print(f"\n🔧 Registering all missing repositories...")
     print(f"   This may take several minutes depending on the number of packages")
 
-    async with httpx.AsyncClient(timeout=600.0) as client:  # 10 minute timeout for agent work
-        response = await client.post(url)
-        response.raise_for_status()
-        result = response.json()
+    response = await client.post(url, timeout=600.0)  # 10 minute timeout for agent work
+    response.raise_for_status()
+    result = orjson.loads(response.content)
 
     print(f"\n✅ Registration complete!")
     print(f"   Total: {result['total']} packages")
@@ -87,29 +140,36 @@ async def register_all(base_url: str) -> Dict[str, Any]:
     print(f"   Failed: {result['failed']}")
 
     # Print details for each result
-    if result.get('results'):
-        print(f"\n📋 Detailed Results:")
-        for res in result['results']:
-            status = "✅" if res['success'] else "❌"
-            print(f"   {status} {res['package_name']}")
-            if res['success']:
-                print(f"      Repo: {res.get('repo_path', 'N/A')}")
-                print(f"      Guide: {res.get('guide_path', 'N/A')}")
-                if res.get('steps_completed'):
-                    print(f"      Steps: {', '.join(res['steps_completed'])}")
+    results = result.get('results')
+    if results:
+        # Collect all lines and write them at once
+        lines = [f"\n📋 Detailed Results:"]
+        append = lines.append
+        for res in results:
+            success = res['success']
+            append(f"   {'✅' if success else '❌'} {res['package_name']}")
+            if success:
+                append(f"      Repo: {res.get('repo_path', 'N/A')}")
+                append(f"      Guide: {res.get('guide_path', 'N/A')}")
+                steps = res.get('steps_completed')
+                if steps:
+                    append(f"      Steps: {', '.join(steps)}")
             else:
-                print(f"      Error: {res.get('error', 'Unknown error')}")
+                append(f"      Error: {res.get('error', 'Unknown error')}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     return result
 
 
-async def main(config_file: Path, base_url: str) -> None:
+async def main(config_file: Path, base_url: str, force_upload: bool = False) -> None:
     """
     Main function to upload config and register all packages.
 
     Args:
         config_file: Path to packages.json file
         base_url: Base URL of the backend API
+        force_upload: Upload even if the backend already has this configuration
     """
     try:
         # Load configuration file
@@ -119,8 +179,9 @@ async def main(config_file: Path, base_url: str) -> None:
             print(f"❌ Error: Configuration file not found: {config_file}")
             sys.exit(1)
 
-        with open(config_file, 'r') as f:
-            config_data = json.load(f)
+        # Read off the event loop; orjson.JSONDecodeError subclasses json.JSONDecodeError
+        raw = await asyncio.to_thread(config_file.read_bytes)
+        config_data = orjson.loads(raw)
 
         if not config_data:
             print(f"❌ Error: Configuration file is empty")
@@ -128,17 +189,30 @@ async def main(config_file: Path, base_url: str) -> None:
 
         print(f"   Loaded {len(config_data)} packages\n")
 
-        # Step 1: Upload configuration
-        upload_result = await upload_config(base_url, config_data)
+        # One client for both calls so the connection is reused
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            timeout=httpx.Timeout(30.0)
+        ) as client:
+            # Step 1: Upload configuration, unless the backend already has it
+            local_digest = None if force_upload else local_config_digest(config_data)
+            if local_digest and await get_config_etag(client, base_url) == local_digest:
+                print(f"⏭️  Configuration unchanged, skipping upload")
+                upload_result = None
+            else:
+                upload_result = await upload_config(client, base_url, config_data)
 
-        # Step 2: Register all packages
+            # Step 2: Register all packages
 
-        # Summary
-        print(f"\n{'='*60}")
-        print(f"📊 Summary")
-        print(f"{'='*60}")
-        print(f"Uploaded: {upload_result['package_count']} packages")
-        register_result = await register_all(base_url)
+            # Summary
+            print(f"\n{'='*60}")
+            print(f"📊 Summary")
+            print(f"{'='*60}")
+            if upload_result:
+                print(f"Uploaded: {upload_result['package_count']} packages")
+            else:
+                print(f"Uploaded: skipped ({len(config_data)} packages unchanged)")
+            register_result = await register_all(client, base_url)
         print(f"Registered: {register_result['successful']}/{register_result['total']} packages")
 
         if register_result['failed'] > 0:
@@ -203,7 +277,13 @@ Examples:
         default=DEFAULT_BASE_URL,
         help=f"Backend API base URL (default: {DEFAULT_BASE_URL})"
     )
+
+    parser.add_argument(
+        "--force-upload",
+        action="store_true",
+        help="Upload the configuration even if the backend already has it"
+    )
     args = parser.parse_args()
 
     # Run async main function
-    asyncio.run(main(args.config_file, args.url))
+    run(main(args.config_file, args.url, args.force_upload))